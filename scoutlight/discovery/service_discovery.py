@@ -1,12 +1,24 @@
 import sys
+from functools import partial
+from heapq import heappush, heappop, heapify
+from threading import Lock
+from time import monotonic
 
-from etcd3 import members
-from typing import List, Dict, Optional
+from typing import List, Dict, Set, Tuple, Optional, Callable
 from abc import ABCMeta, abstractmethod
 from scoutlight.exceptions import DiscoveryException
 from scoutlight.key_factory import Keys
+from scoutlight.properties_serializer import JsonDictPropertiesConverter
 from scoutlight.registry import Registry
 
+# Default time, in seconds, a service locator reuses a fetched list of service members before fetching it again.
+# Changes are pushed to service locators via registry watches, so this value only bounds staleness in case a change
+# notification is lost.
+DEFAULT_MEMBERS_CACHE_TTL = 30.0
+
+# Converter of service instance properties, as stored in the registry.
+_PROPERTIES_CONVERTER = JsonDictPropertiesConverter()
+
 
 class ServiceDiscoveryException(DiscoveryException):
     """
@@ -23,16 +35,58 @@ class ServiceUnavailableException(ServiceDiscoveryException):
     pass
 
 
-class ServiceLocatorStrategy(object):
-    __metaclass__ = ABCMeta
-
+class ServiceLocatorStrategy(metaclass=ABCMeta):
     def __init__(self):
         pass
 
 
-class ServiceLocator(object):
-    __metaclass__ = ABCMeta
+class _CachedMemberList(object):
+    """
+    A single-entry, time-bounded cache of a service members list.
+    """
+
+    def __init__(self, ttl, loader):
+        # type: (float, Callable[[], List[str]]) -> None
+        """
+        Class initializer.
+
+        :param ttl: Time, in seconds, a cached members list is considered valid. Zero disables caching.
+        :param loader: A callable fetching an up-to-date members list.
+        """
+        self._ttl = ttl  # type: float
+        self._loader = loader  # type: Callable[[], List[str]]
+        self._expiry = 0.0  # type: float
+        self._members = None  # type: Optional[Tuple[str, ...]]
+        self._lock = Lock()
+
+    def get(self):
+        # type: () -> Tuple[str, ...]
+        """
+        Return the cached members list, reloading it if the cached list has expired.
+
+        :return: Tuple of members.
+        """
+        if self._ttl <= 0:
+            return tuple(self._loader())
+
+        with self._lock:
+            now = monotonic()  # type: float
+            if self._members is None or now >= self._expiry:
+                self._members = tuple(self._loader())
+                self._expiry = now + self._ttl
+
+            return self._members
+
+    def invalidate(self):
+        # type: () -> None
+        """
+        Drop the cached members list. The next call to 'get' reloads it.
+        """
+        with self._lock:
+            self._members = None
 
+
+class ServiceLocator(metaclass=ABCMeta):
     """
     A locator of service instances within a cluster.
 
@@ -42,20 +96,38 @@ class ServiceLocator(object):
     via service instance properties) to select the most suitable service instance available at each given moment.
     """
 
-    def __init__(self, registry, cluster_id, service_name):
-        # type: (Registry, str, str) -> None
+    def __init__(self, registry, cluster_id, service_name, members_cache_ttl=DEFAULT_MEMBERS_CACHE_TTL):
+        # type: (Registry, str, str, float) -> None
         """
         Class initializer.
 
         :param registry: Registry to get a list of available service instances.
         :param cluster_id: Cluster identifier.
         :param service_name: Name of service.
+        :param members_cache_ttl: Time, in seconds, to reuse a fetched list of service instances before fetching it
+                                  from the registry again. Set to zero to disable caching.
         """
+        assert isinstance(members_cache_ttl, (int, float)) and members_cache_ttl >= 0, \
+            "'members_cache_ttl' must be a non-negative number."
+
         self._registry = registry  # type: Registry
         self._cluster_id = cluster_id  # type: str
         self._service_name = service_name  # type: str
 
-        self._service_members_key = Keys.create_service_members_base_key(cluster_id, service_name)  # type: str
+        # Interned, since the same key is used for every registry query and cache lookup.
+        self._service_members_key = sys.intern(
+            Keys.create_service_members_base_key(cluster_id, service_name))  # type: str
+
+        self._members_cache = _CachedMemberList(members_cache_ttl,
+                                                partial(registry.list_keys,
+                                                        self._service_members_key))  # type: _CachedMemberList
+
+        # Drop cached members list whenever a service instance is added, removed or updated.
+        self._cancel_members_watch = registry.watch_prefix(self._service_members_key,
+                                                           self._members_cache.invalidate)  # type: Callable[[], None]
+
+        # True if the locator is shared by a ServiceDiscovery, which releases it (see ServiceDiscovery.close).
+        self._shared = False  # type: bool
 
     @abstractmethod
     def find_service(self):
@@ -66,16 +138,50 @@ class ServiceLocator(object):
 
         :raises ServiceUnavailableException: If no available services instance found.
         """
-        raise NotImplementedError()
+        ...
+
+    def close(self):
+        # type: () -> None
+        """
+        Release the resources held by this locator (e.g.: registry watches).
+
+        Locators created by ServiceDiscovery are shared, so closing them is a no-op; they are released when the
+        ServiceDiscovery is closed.
+        """
+        if not self._shared:
+            self._release()
+
+    def _release(self):
+        # type: () -> None
+        """
+        Release the resources held by this locator, whether it is shared or not.
+        """
+        self._cancel_members_watch()
+
+    def _list_members(self):
+        # type: () -> Tuple[str, ...]
+        """
+        :return: Identifiers of all available service instances. The list may be served from a short-lived cache.
+        """
+        return self._members_cache.get()
 
 
 class RoundRobingServiceLocator(ServiceLocator):
 
-    def __init__(self, registry, cluster_id, service_name):
-        super(RoundRobingServiceLocator, self).__init__(registry, cluster_id, service_name)
+    def __init__(self, registry, cluster_id, service_name, members_cache_ttl=DEFAULT_MEMBERS_CACHE_TTL):
+        super(RoundRobingServiceLocator, self).__init__(registry, cluster_id, service_name, members_cache_ttl)
+
+        # Min-heap of (usage count, instance id) pairs. Entries of removed or re-counted instances are not removed
+        # eagerly; they are discarded lazily when popped.
+        self._heap = []  # type: List[Tuple[int, str]]
 
-        # Maintain a list of known services and their usage statistics.
-        self._justice_table = {}  # type: Dict[str, int]
+        # Maintain a set of known services and their usage statistics.
+        self._members = None  # type: Optional[Tuple[str, ...]]
+        self._known = set()  # type: Set[str]
+        self._counts = {}  # type: Dict[str, int]
+
+        # Guards the usage statistics above; a locator may be shared across threads.
+        self._lock = Lock()
 
     def find_service(self):
         # type: () -> str
@@ -85,28 +191,55 @@ class RoundRobingServiceLocator(ServiceLocator):
         """
 
         # Fetch the list of all available service instances.
-        existing_members = self._registry.list_keys(self._service_members_key)  # type: List[str]
+        members = self._list_members()  # type: Tuple[str, ...]
+
+        with self._lock:
+            # The members cache returns the very same tuple until the members list changes; only then the difference
+            # between the known instances and the available ones needs to be applied.
+            if members is not self._members:
+                self.__apply_members(members)
+
+            # Pop until we find an entry which is up-to-date with our usage statistics.
+            while self._heap:
+                usage_frequency, member = heappop(self._heap)
+                if self._counts.get(member) != usage_frequency:
+                    # Stale entry.
+                    continue
+
+                self._counts[member] = usage_frequency + 1
+                heappush(self._heap, (usage_frequency + 1, member))
+                return member
+
+        raise ServiceUnavailableException("No instance available for service '{}'.".format(self._service_name))
+
+    def __apply_members(self, members):
+        # type: (Tuple[str, ...]) -> None
+        """
+        Apply the difference between known instances and a given up-to-date list of instances. Called with the lock
+        held.
+
+        New instances start with no usage; removed instances are dropped from the usage statistics and their heap
+        entries become stale.
 
-        # Create a new 'justice table' given the available list of instances identifiers.
-        # Re-use statistics from existing justice table.
-        # During construction - detect the lowest used instance.
-        least_used_instance_id = None  # type: Optional[str]
-        lowest_frequency = sys.maxint
-        new_justice_table = {}  # type: Dict[str, int]
-        for member in existing_members:
-            usage_frequency = new_justice_table[member] = self._justice_table.get(member, 0)
-            if usage_frequency < lowest_frequency:
-                lowest_frequency = usage_frequency
-                least_used_instance_id = member
+        :param members: Identifiers of all available instances.
+        """
+        existing_members = set(members)  # type: Set[str]
 
-        if least_used_instance_id is None:
-            raise ServiceUnavailableException("No instance available for service '{}'.".format(self._service_name))
+        added = existing_members - self._known  # type: Set[str]
+        self._counts.update(dict.fromkeys(added, 0))
+        if len(added) > len(self._heap):
+            # Many new instances (e.g.: first lookup) -- re-heapifying at once is cheaper than pushing one by one.
+            self._heap.extend((0, member) for member in added)
+            heapify(self._heap)
+        else:
+            for member in added:
+                heappush(self._heap, (0, member))
 
-        # Update justice table.
-        new_justice_table[least_used_instance_id] = lowest_frequency + 1
-        self._justice_table = new_justice_table
+        for member in self._known - existing_members:
+            del self._counts[member]
 
-        return least_used_instance_id
+        self._known = existing_members
+        self._members = members
 
 
 class ServiceInstance(object):
@@ -114,6 +247,9 @@ class ServiceInstance(object):
     Represents a service instance and its properties.
     """
 
+    # Service instances may be listed in large numbers. Avoid a per-instance __dict__.
+    __slots__ = ('cluster_id', 'service_name', 'instance_id', 'properties')
+
     def __init__(self, cluster_id, service_name, instance_id, properties):
         # type: (str, str, str, Dict[str,str]) -> None
         """
@@ -132,6 +268,19 @@ class ServiceInstance(object):
 
 class ServiceDiscovery(object):
 
+    def __init__(self, registry):
+        # type: (Registry) -> None
+        """
+        Class initializer.
+
+        :param registry: Registry holding clusters, services and service instances.
+        """
+        self._registry = registry  # type: Registry
+
+        # Service locators are kept for reuse, so their usage statistics survive across lookups.
+        self._locators = {}  # type: Dict[Tuple[str, str], ServiceLocator]
+        self._locators_lock = Lock()
+
     def list_clusters(self):
         # type: () -> List[str]
         """
@@ -156,8 +305,14 @@ class ServiceDiscovery(object):
         :param cluster_id: Cluster identifier.
         :param service_name: Service name.
         :return: List of service instances.
+        :raises MalformedPropertiesException: If the properties of a service instance could not be deserialized.
         """
-        pass
+        # Fetch all members and their properties in a single registry round-trip.
+        members = self._registry.fetch(Keys.create_service_members_base_key(cluster_id, service_name))
+
+        return [ServiceInstance(cluster_id, service_name, member_key.rsplit('/', 1)[-1],
+                                _PROPERTIES_CONVERTER.from_string(raw_properties))
+                for member_key, raw_properties in members.items()]
 
     def register_service(self, cluster_id, service_name, properties):
         # type: (str, str, Dict[str, str]) -> ServiceInstance
@@ -197,4 +352,35 @@ class ServiceDiscovery(object):
 
     def create_service_locator(self, cluster_id, service_name):
         # type: (str, str) -> ServiceLocator
-        pass
+        """
+        Return a service locator for a given service.
+
+        Locators are shared: repeated calls for the same cluster and service return the same locator.
+
+        :param cluster_id: Cluster identifier.
+        :param service_name: Service name.
+        :return: Service locator.
+        """
+        locator_key = (cluster_id, service_name)  # type: Tuple[str, str]
+        with self._locators_lock:
+            locator = self._locators.get(locator_key)  # type: Optional[ServiceLocator]
+            if locator is None:
+                locator = self._locators[locator_key] = RoundRobingServiceLocator(self._registry, cluster_id,
+                                                                                  service_name)
+                # noinspection PyProtectedMember
+                locator._shared = True
+
+        return locator
+
+    def close(self):
+        # type: () -> None
+        """
+        Release all service locators created by this object. Locators created afterwards are new ones.
+        """
+        with self._locators_lock:
+            locators = list(self._locators.values())  # type: List[ServiceLocator]
+            self._locators.clear()
+
+        for locator in locators:
+            # noinspection PyProtectedMember
+            locator._release()
@@ -1,4 +1,11 @@
-from scoutlight.tools.key_tools import normalize_key, construct_key
+import sys
+from functools import lru_cache
+
+# noinspection PyProtectedMember
+from scoutlight.tools.key_tools import _normalize_key_fast
+
+# Maximum number of keys each factory method keeps in its cache.
+KEYS_CACHE_SIZE = 2048
 
 
 class Keys:
@@ -7,6 +14,7 @@ class Keys:
         raise NotImplementedError('Class should not be instantiated.')
 
     @staticmethod
+    @lru_cache(maxsize=KEYS_CACHE_SIZE)
     def create_cluster_key(cluster_id):
         # type: (str) -> str
         """
@@ -15,10 +23,11 @@ class Keys:
         :param cluster_id: Cluster identifier.
         :return: Cluster key.
         """
-        assert Keys.__assert_valid_input(cluster_id)
-        return normalize_key(cluster_id)
+        Keys.__assert_valid_input(cluster_id)
+        return _normalize_key_fast(cluster_id)
 
     @staticmethod
+    @lru_cache(maxsize=KEYS_CACHE_SIZE)
     def create_service_base_key(cluster_id):
         # type: (str) -> str
         """
@@ -27,9 +36,10 @@ class Keys:
         :param cluster_id: Cluster identifier.
         :return: Service base key.
         """
-        return construct_key(Keys.create_cluster_key(cluster_id), 'services')
+        return _normalize_key_fast(Keys.create_cluster_key(cluster_id) + '/services')
 
     @staticmethod
+    @lru_cache(maxsize=KEYS_CACHE_SIZE)
     def create_service_key(cluster_id, service_name):
         # type: (str, str) -> str
         """
@@ -41,10 +51,11 @@ class Keys:
         :param service_name: Service name.
         :return: Service key.
         """
-        assert Keys.__assert_valid_input(service_name)
-        return construct_key(Keys.create_service_base_key(cluster_id), service_name)
+        Keys.__assert_valid_input(service_name)
+        return _normalize_key_fast(Keys.create_service_base_key(cluster_id) + '/' + service_name)
 
     @staticmethod
+    @lru_cache(maxsize=KEYS_CACHE_SIZE)
     def create_service_members_base_key(cluster_id, service_name):
         # type: (str, str) -> str
         """
@@ -53,10 +64,11 @@ class Keys:
         E.g., for cluster 'my_cluster' and service 'my_service', create the key:
         '/my_cluster/services/my_service/members'.
         """
-
-        return construct_key(Keys.create_service_key(cluster_id, service_name), 'members')
+        # Service key is already normalized (and cached), so appending a constant part keeps it normalized.
+        return sys.intern(Keys.create_service_key(cluster_id, service_name) + '/members')
 
     @staticmethod
+    @lru_cache(maxsize=KEYS_CACHE_SIZE)
     def create_service_instance_key(cluster_id, service_name, instance_id):
         # type: (str, str, str) -> str
         """
@@ -67,8 +79,9 @@ class Keys:
         :param instance_id: Instance identifier.
         :return: Service instance key.
         """
-        assert Keys.__assert_valid_input(instance_id)
-        return construct_key(Keys.create_service_members_base_key(cluster_id, service_name), instance_id)
+        Keys.__assert_valid_input(instance_id)
+        members_base_key = Keys.create_service_members_base_key(cluster_id, service_name)  # type: str
+        return sys.intern(_normalize_key_fast(members_base_key + '/' + instance_id))
 
     @staticmethod
     def __assert_valid_input(s):
@@ -77,6 +90,8 @@ class Keys:
         Assert that a given object is a valid non-empty string.
 
         :param s: Object to be validated.
-        :raises AssertionError: If input is either not a string or an empty string.
+        :raises ValueError: If input is either not a string or an empty (or whitespace-only) string.
         """
-        assert isinstance(s, basestring) and len(s.strip()) > 0, "Invalid input."
+        # Explicit check (rather than 'assert') so validation is not stripped under 'python -O'.
+        if not (isinstance(s, str) and s and not s.isspace()):
+            raise ValueError("Invalid input: {!r}.".format(s))
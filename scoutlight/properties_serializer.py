@@ -1,4 +1,6 @@
 from abc import ABCMeta, abstractmethod
+
+import orjson
 from typing import Any, Optional
 
 from scoutlight.exceptions import DiscoveryException
@@ -26,13 +28,11 @@ class MalformedPropertiesException(PropertiesConverterException):
     pass
 
 
-class PropertiesConverter(object):
+class PropertiesConverter(metaclass=ABCMeta):
     """
     Serialize and deserializer properties from object domain (e.g.: dictionary, list, custom data objects) to
     raw string and vice versa.
     """
-    __metaclass__ = ABCMeta
-
     def __init__(self, supported_type=None):
         # type: (Optional[type]) -> None
         """
@@ -54,7 +54,7 @@ class PropertiesConverter(object):
         :return: String representation of properties set.
         :raises UnsupportedPropertiesTypeException: If the converted does not support the provided object type.
         """
-        raise NotImplementedError()
+        ...
 
     @abstractmethod
     def from_string(self, raw_properties):
@@ -67,7 +67,7 @@ class PropertiesConverter(object):
         :return: Object representation of properties set.
         :raises MalformedPropertiesException: If the raw data could not be deserialized to object.
         """
-        raise NotImplementedError()
+        ...
 
     def supports(self, obj):
         # type: (Any) -> bool
@@ -103,7 +103,7 @@ class PropertiesConverter(object):
         :param st: Object to test as a string.
         :raises TypeError: If the provided object is not a string type.
         """
-        if not isinstance(st, basestring):
+        if not isinstance(st, str):
             raise TypeError("Expected a string type, got {}.".format(type(st)))
 
 
@@ -120,8 +120,22 @@ class JsonDictPropertiesConverter(PropertiesConverter):
 
     def to_string(self, properties):
         # type: (dict) -> str
-
-        pass
+        self._assert_object_type(properties)
+        try:
+            return orjson.dumps(properties).decode('utf-8')
+        except orjson.JSONEncodeError as e:
+            raise UnsupportedPropertiesTypeException("Properties could not be serialized to JSON: {}".format(e))
 
     def from_string(self, raw_properties):
-        pass
+        # type: (str) -> dict
+        self._assert_input(raw_properties)
+        try:
+            properties = orjson.loads(raw_properties)
+        except orjson.JSONDecodeError as e:
+            raise MalformedPropertiesException("Malformed JSON properties: {}".format(e))
+
+        if not isinstance(properties, dict):
+            raise MalformedPropertiesException(
+                "Expected a JSON object, got {} instead.".format(type(properties).__name__))
+
+        return properties
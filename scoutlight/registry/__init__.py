@@ -1,11 +1,14 @@
+import logging
 from abc import ABCMeta, abstractmethod
 
-from typing import Optional, Tuple, List, Dict, Union
+from typing import Optional, Tuple, List, Dict, Union, Callable, Iterable, Iterator
 
 from scoutlight.exceptions import DiscoveryException
 from scoutlight.registry.key import Key
 from scoutlight.tools.lifecycle import Lifecycle
 
+logger = logging.getLogger(__name__)
+
 
 class KeyDoesNotExist(DiscoveryException):
     """
@@ -14,11 +17,11 @@ class KeyDoesNotExist(DiscoveryException):
     pass
 
 
-class Registry(Lifecycle):
+class Registry(Lifecycle, metaclass=ABCMeta):
     """
         A strategy design pattern used for registering and querying services in a repository.
         """
-    __metaclass__ = ABCMeta
+    __slots__ = ()
 
     def __init__(self):
         # type: () -> None
@@ -51,10 +54,30 @@ class Registry(Lifecycle):
                       Must be a valid string.
         :return: True if the key was set, False otherwise.
         """
-        k = self._to_key(k)
-        self._assert_value(value)
+        k = self._as_key(k)
+        if type(value) is not str:
+            self._assert_value(value)
+
+        return self._put([(k, value)], k)
+
+    def put_if_not_exist_or_get(self, k, value):
+        # type: (Union[Key, str], str) -> Tuple[bool, str]
+        """
+        Set a key's value if key is not defined yet, otherwise get its existing value.
+
+        Saves a follow-up 'get' (and, for remote registries, a round-trip) when the key already exists.
+
+        :param k: Key to set.
+        :param value: Value to set.
+                      Must be a valid string.
+        :return: A tuple of: True if the key was set, False otherwise, and the key's value -- either the given value
+                 (if set) or the existing value.
+        """
+        k = self._as_key(k)
+        if type(value) is not str:
+            self._assert_value(value)
 
-        return self._put((k, value), k)
+        return self._put_if_not_exist_or_get(k, value)
 
     def put(self, k, v):
         # type: (Union[Key, str], str) -> None
@@ -64,22 +87,44 @@ class Registry(Lifecycle):
         :param v: Value to set.
         """
         k = self._as_key(k)
-        self._assert_value(v)
 
-        return self._put([(k, v)])
+        # Values are almost always plain strings; validate anything else.
+        if type(v) is not str:
+            self._assert_value(v)
+
+        self._put_one(k, v)
 
     # noinspection StructuralWrap
     def put_all(self, values):
         # type: (Union[Dict[Union[Key, str], str], Tuple[Union[Key, str], str], List[Tuple[Union[Key, str], str]]]) -> None
         """
-        Set a group of values atomically.
-        Either all values are set or none is set.
+        Set a group of values.
+        Groups are set atomically (either all values are set or none is set), up to the size of a single transaction
+        of the backing store. Larger groups may be split into several transactions, each set atomically; the group as
+        a whole is not (e.g.: Etcd3Registry splits groups of more than its MAX_TXN_OPS values).
 
         :param values: Set of values.
                        It can be either a dictionary, a single tuple (key/value pair) or a list of
                        tuples (a set of key/value pairs).
         """
-        kv_list = self._to_kv_list(values)
+        kv_list = self._to_tuple_list(values)
+        self._put(kv_list)
+
+    def put_all_keys(self, pairs):
+        # type: (Iterable[Tuple[Key, str]]) -> None
+        """
+        Set a group of values, given as Key objects.
+        Atomic under the same terms as 'put_all'.
+
+        Same as 'put_all', without converting the keys; implementations may also take advantage of the keys being
+        pre-split to parts (e.g.: to insert keys sharing a prefix together).
+
+        :param pairs: Key/value pairs.
+        """
+        kv_list = list(pairs)  # type: List[Tuple[Key, str]]
+        assert all(isinstance(k, Key) and isinstance(v, str) for k, v in kv_list), \
+            "Invalid pairs (all keys must be Key objects and all values must be of a string type)."
+
         self._put(kv_list)
 
     def get(self, k):
@@ -92,8 +137,8 @@ class Registry(Lifecycle):
         """
         return self._get_one(self._as_key(k))
 
-    def list_keys(self, parent_key, recursive=False, keep_order=False):
-        # type: (Union[Key, str], bool, bool) -> List[str]
+    def list_keys(self, parent_key, recursive=False, keep_order=False, limit=None):
+        # type: (Union[Key, str], bool, bool, Optional[int]) -> List[str]
         """
         Fetch all children keys for a given parent.
 
@@ -105,13 +150,15 @@ class Registry(Lifecycle):
         :param parent_key: Parent key to fetch children keys for.
         :param recursive: True to recursively fetch children keys, False to fetch only immediate children.
         :param keep_order: True to return the list in order of creation, False otherwise.
+        :param limit: Maximum number of keys to return, or None for no limit.
         :return: List of keys under given parent.
         :raises KeyDoesNotExist: If the parent key does not exist.
         """
-        return list(self._get(self._as_key(parent_key), recursive, keep_order, True, True).keys())
+        assert limit is None or (isinstance(limit, int) and limit > 0), "'limit' must be a positive integer."
+        return self._list_keys(self._as_key(parent_key), recursive, keep_order, limit)
 
-    def fetch(self, parent_key, recursive=False, keep_order=False):
-        # type: (Union[Key, str], bool, bool) -> Dict[str, str]
+    def fetch(self, parent_key, recursive=False, keep_order=False, limit=None):
+        # type: (Union[Key, str], bool, bool, Optional[int]) -> Dict[str, str]
         """
         Fetch all children keys and values for a given parent.
 
@@ -121,14 +168,46 @@ class Registry(Lifecycle):
         :param parent_key: Parent key to fetch children keys for.
         :param recursive: True to recursively fetch children keys, False to fetch only immediate children.
         :param keep_order: If set to True, the returned dictionary will retain the original order of the children
-                           (sorted by creation) using OrderedDict.
-                           If set to False, the returned dictionary may not retain the original order of the keys
-                           (use Python standard dictionary), however, the model may be more efficient.
+                           (sorted by creation).
+                           If set to False, the returned dictionary may not retain the original order of the keys,
+                           however, the query may be more efficient.
                            Typically useful for large datasets.
-        :return: A dictionary holding all keys and their values.
+        :param limit: Maximum number of key/value pairs to return, or None for no limit.
+        :return: A (plain, insertion-ordered) dictionary holding all keys and their values.
         :raises KeyDoesNotExist: If the parent key does not exist.
         """
-        return self._get(self._as_key(parent_key), recursive, keep_order, False, True)
+        assert limit is None or (isinstance(limit, int) and limit > 0), "'limit' must be a positive integer."
+        return self._get(self._as_key(parent_key), recursive, keep_order, False, True, limit)
+
+    def iter_fetch(self, parent_key, recursive=False, keep_order=False):
+        # type: (Union[Key, str], bool, bool) -> Iterator[Tuple[str, str]]
+        """
+        Iterate over all children keys and values of a given parent.
+
+        Same as 'fetch', for callers that consume the results once: implementations may stream the results rather than
+        collect them all first.
+
+        :param parent_key: Parent key to fetch children keys for.
+        :param recursive: True to recursively fetch children keys, False to fetch only immediate children.
+        :param keep_order: True to iterate in order of creation, False for any order.
+        :return: An iterator of key/value pairs.
+        """
+        return self._iter_get(self._as_key(parent_key), recursive, keep_order)
+
+    def watch_prefix(self, parent_key, callback):
+        # type: (Union[Key, str], Callable[[], None]) -> Callable[[], None]
+        """
+        Watch a parent key for changes.
+
+        The callback is issued, with no arguments, whenever the parent key or any of its children is changed.
+        It may be issued from a thread other than the caller's thread.
+
+        :param parent_key: Parent key to watch.
+        :param callback: Callback to issue upon changes.
+        :return: A callable that cancels the watch.
+        """
+        assert callable(callback), "Invalid callback parameter."
+        return self._watch_prefix(self._as_key(parent_key), callback)
 
     @abstractmethod
     def _put(self, kv_list, conditional_key_exist=None):
@@ -142,7 +221,37 @@ class Registry(Lifecycle):
                                       exist.
         :return: True if the key/value pairs were set, False otherwise.
         """
-        raise NotImplementedError()
+        ...
+
+    def _put_one(self, k, v):
+        # type: (Key, str) -> None
+        """
+        Set a single key/value pair, unconditionally.
+
+        The default implementation delegates to '_put'. Implementations may override this method with a cheaper
+        single-key operation.
+
+        :param k: Key to set.
+        :param v: Value to set.
+        """
+        self._put([(k, v)])
+
+    def _put_if_not_exist_or_get(self, k, value):
+        # type: (Key, str) -> Tuple[bool, str]
+        """
+        Set a key's value if key is not defined yet, otherwise get its existing value.
+
+        The default implementation issues a conditional '_put' followed by '_get_one' if the key exists.
+        Implementations may override this method with a single atomic operation.
+
+        :param k: Key to set.
+        :param value: Value to set.
+        :return: A tuple of: True if the key was set, False otherwise, and the key's value.
+        """
+        if self._put([(k, value)], k):
+            return True, value
+
+        return False, self._get_one(k)
 
     @abstractmethod
     def _get_one(self, get_key):
@@ -156,17 +265,17 @@ class Registry(Lifecycle):
         :return: Value associated with the given key.
         :raises KeyDoesNotExist: If the key does not exist.
         """
-        raise NotImplementedError()
+        ...
 
     @abstractmethod
-    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True):
-        # type: (Key, bool, bool, bool, bool) -> Dict[Key, str]
+    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True, limit=None):
+        # type: (Key, bool, bool, bool, bool, Optional[int]) -> Dict[str, str]
         """
         Fetch one or more values from the store.
 
         The operation supports multiple criteria.
-            - If keep_order is True, then the returned value is an OrderedDict with all key/value pairs sorted by
-              creation date, in ascending order.
+            - If keep_order is True, then the returned dictionary holds all key/value pairs in order of creation
+              date, in ascending order. Dictionaries retain insertion order, so no ordered mapping type is needed.
             - If keys_only is set to True, the dictionary includes only keys.
               Values are set to empty strings and
               should be ignored by caller.
@@ -183,10 +292,54 @@ class Registry(Lifecycle):
                           False to fetch both keys and values.
         :param exclude_parent_keys: If True, the returned result will not include the parent key (i.e.: get_key).
                                     False will cause the inclusion of the parent key.
+        :param limit: Maximum number of key/value pairs to return, or None for no limit.
         :return: A dictionary with key/value pair(s).
         :raises KeyDoesNotExist: If the key does not exist.
         """
-        raise NotImplementedError()
+        ...
+
+    def _list_keys(self, parent_key, recursive=False, keep_order=False, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> List[str]
+        """
+        Fetch the children keys of a given parent key.
+
+        The default implementation delegates to '_get'. Implementations may override this method to produce the list
+        directly, without an intermediate dictionary.
+
+        :param parent_key: Parent key to fetch children keys for.
+        :param recursive: True to recursively fetch children keys, False to fetch only immediate children.
+        :param keep_order: True to return the list in order of creation, False otherwise.
+        :param limit: Maximum number of keys to return, or None for no limit.
+        :return: List of keys under given parent.
+        """
+        return list(self._get(parent_key, recursive, keep_order, True, True, limit).keys())
+
+    def _iter_get(self, get_key, recursive=False, keep_order=False):
+        # type: (Key, bool, bool) -> Iterator[Tuple[str, str]]
+        """
+        Iterate over the children keys and values of a given key.
+
+        The default implementation iterates over the result of '_get'. Implementations may override this method to
+        stream the results.
+
+        :param get_key: Parent key.
+        :param recursive: True to recursively fetch all keys, False to fetch only immediate children.
+        :param keep_order: True to iterate in order of creation, False for any order.
+        :return: An iterator of key/value pairs.
+        """
+        return iter(self._get(get_key, recursive, keep_order, False, True).items())
+
+    @abstractmethod
+    def _watch_prefix(self, watch_key, callback):
+        # type: (Key, Callable[[], None]) -> Callable[[], None]
+        """
+        Register a callback issued whenever a key or any of its children is changed.
+
+        :param watch_key: Key to watch.
+        :param callback: Callback to issue upon changes.
+        :return: A callable that cancels the watch.
+        """
+        ...
 
     @staticmethod
     def _as_key(key_or_string):
@@ -201,6 +354,12 @@ class Registry(Lifecycle):
         :return: A Key object.
         :raises AssertionError: If provided parameter is neither a string nor a Key.
         """
+        # Fast path for the common, exact, types.
+        key_type = type(key_or_string)
+        if key_type is Key:
+            return key_or_string
+        if key_type is str:
+            return Key.create(key_or_string)
 
         if isinstance(key_or_string, Key):
             # Do nothing. It's already a Key.
@@ -222,7 +381,7 @@ class Registry(Lifecycle):
         :param value: Value to examine.
         :raises AssertionError: If value is not valid.
         """
-        assert isinstance(value, basestring), "Invalid value (must be a string type, got {} instead.).".format(
+        assert isinstance(value, str), "Invalid value (must be a string type, got {} instead.).".format(
             type(value))
 
     # noinspection StructuralWrap
@@ -237,25 +396,65 @@ class Registry(Lifecycle):
         :raises TypeError: If values are neither of: tuple, list of tuples, dictionary.
         :raises AssertionError: If either keys or values are not of string type or key is an empty string.
         """
-        pair_list = []  # type: List[Tuple[Key, str]]
-
-        def append_pair(_k, _v):
-            _k = self._to_key(_k)
-            self._assert_value(_v)
-            pair_list.append((_k, _v))
-
         if isinstance(values, dict):
-            for k, v in values.items():
-                append_pair(k, v)
+            keys = list(values.keys())  # type: List[Union[Key, str]]
+            vals = list(values.values())  # type: List[str]
         elif isinstance(values, tuple):
             assert len(values) == 2, "Invalid tuple length (must be 2 -- key/value pair)."
-            append_pair(values[0], values[1])
+            keys = [values[0]]
+            vals = [values[1]]
         elif isinstance(values, list):
-            for list_item in values:
-                assert isinstance(list_item, tuple) and len(
-                    list_item) == 2, "Values list contains a non-tuple key/value pair."
-                append_pair(values[0], values[1])
+            assert all(isinstance(list_item, tuple) and len(list_item) == 2 for list_item in values), \
+                "Values list contains a non-tuple key/value pair."
+            keys = [list_item[0] for list_item in values]
+            vals = [list_item[1] for list_item in values]
         else:
             raise TypeError("Unsupported input type: {}.".format(type(values)))
 
-        return pair_list
+        # Validate all values in one pass before converting any key.
+        assert all(isinstance(v, str) for v in vals), "Invalid value (all values must be of a string type)."
+
+        return [(self._as_key(k), v) for k, v in zip(keys, vals)]
+
+
+class LocalRegistry(Registry, metaclass=ABCMeta):
+    """
+    A registry whose keys are all changed through it (e.g.: an in-memory registry), so watches are kept and notified
+    locally. Implementations call '_notify_watches' once they set values.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """
+        Class initializer.
+        """
+        super(LocalRegistry, self).__init__()
+
+        # Registered watches: watch identifier -> (watched key, watched key's children prefix, callback).
+        self._watches = {}  # type: Dict[int, Tuple[str, str, Callable[[], None]]]
+        self._next_watch_id = 0  # type: int
+
+    def _watch_prefix(self, watch_key, callback):
+        # type: (Key, Callable[[], None]) -> Callable[[], None]
+        watch_id = self._next_watch_id  # type: int
+        self._next_watch_id += 1
+        self._watches[watch_id] = (watch_key.key, watch_key.key + '/', callback)
+
+        return lambda: self._watches.pop(watch_id, None)
+
+    def _notify_watches(self, kv_list):
+        # type: (List[Tuple[Key, str]]) -> None
+        """
+        Issue the callbacks of all watches affected by the given key/value pairs.
+
+        :param kv_list: Key/value pairs that were set.
+        """
+        keys = [key.key for key, _ in kv_list]  # type: List[str]
+
+        for watch_key, prefix, callback in list(self._watches.values()):
+            if any(key == watch_key or key.startswith(prefix) for key in keys):
+                # noinspection PyBroadException
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Error during watch callback ({}).".format(watch_key))
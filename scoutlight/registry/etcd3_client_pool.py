@@ -0,0 +1,73 @@
+from threading import Lock
+
+import etcd3
+from etcd3 import Etcd3Client
+from typing import Dict, List, Optional, Tuple
+
+# Default number of clients (i.e.: gRPC channels) maintained per etcd endpoint.
+DEFAULT_POOL_SIZE = 4
+
+
+class Etcd3ClientPool(object):
+    """
+    A process-wide pool of etcd3 clients, keyed by etcd endpoint (host and port).
+
+    Up to 'pool_size' clients are created per endpoint. Once the pool of an endpoint is full, clients are handed out in
+    round-robin order, so multiple registries connected to the same endpoint share a bounded number of gRPC channels.
+
+    A caller should keep using the client it acquired: leases and watches are bound to the client that created them.
+    """
+
+    _instance = None  # type: Optional[Etcd3ClientPool]
+    _instance_lock = Lock()
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
+        # type: (int) -> None
+        """
+        Class initializer.
+
+        :param pool_size: Maximum number of clients per endpoint.
+        """
+        assert isinstance(pool_size, int) and pool_size > 0, "'pool_size' must be a positive integer."
+
+        self._pool_size = pool_size  # type: int
+        self._lock = Lock()
+
+        # Clients per endpoint and the index of the next client to hand out.
+        self._clients = {}  # type: Dict[Tuple[str, int], List[Etcd3Client]]
+        self._next_index = {}  # type: Dict[Tuple[str, int], int]
+
+    @classmethod
+    def instance(cls):
+        # type: () -> Etcd3ClientPool
+        """
+        :return: The process-wide client pool.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = Etcd3ClientPool()
+
+            return cls._instance
+
+    def acquire(self, host, port):
+        # type: (str, int) -> Etcd3Client
+        """
+        Return a client connected to a given endpoint.
+
+        :param host: Hostname or IP address of the etcd server.
+        :param port: The etcd port.
+        :return: An etcd3 client.
+        """
+        endpoint = (host, port)  # type: Tuple[str, int]
+
+        with self._lock:
+            clients = self._clients.setdefault(endpoint, [])  # type: List[Etcd3Client]
+            if len(clients) < self._pool_size:
+                client = etcd3.client(host=host, port=port)
+                clients.append(client)
+                return client
+
+            index = self._next_index.get(endpoint, 0)  # type: int
+            self._next_index[endpoint] = (index + 1) % self._pool_size
+
+            return clients[index]
@@ -1,17 +1,17 @@
 import logging
-from collections import OrderedDict
-from threading import Thread, Event
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
+from threading import Thread, Event, Lock, Timer
 
-import etcd3
-from etcd3 import Lease
+from etcd3 import Etcd3Client, Lease, etcdrpc
 from etcd3.client import KVMetadata
-from etcd3.transactions import Put, Version
-from typing import Dict, Optional, List, Tuple, Generator
+from etcd3.transactions import Get, Put, Version
+from typing import Dict, Optional, List, Tuple, Generator, Callable, Union, Iterator
 
 from scoutlight.registry import Registry, KeyDoesNotExist
+from scoutlight.registry.etcd3_client_pool import Etcd3ClientPool
 from scoutlight.registry.key import Key
 from scoutlight.tools.key_tools import normalize_key
-from scoutlight.tools.periodic_timer import PeriodicTimer
 
 # Root key where all services are registered under.
 ROOT_KEY = Key.create("/registry")
@@ -25,13 +25,165 @@ DEFAULT_LEASE_TTL = 12
 # Extra time-to-live buffer.
 LEASE_TTL_BUFFER = 4
 
-# Default interval, in seconds, for refreshing all leases.
-# THIS VALUE MUST BE LESS THAN OR EQUAL TO LEASE TTL.
-_DEFAULT_LEASE_REFRESH_INTERVAL_SECONDS = DEFAULT_LEASE_TTL  # type: int
+# Time, in seconds, to wait before re-opening a failed lease keep-alive stream.
+LEASE_KEEP_ALIVE_RETRY_INTERVAL = 1
+
+# Maximum time, in seconds, to wait for the lease keep-alive thread to exit during destroy.
+LEASE_KEEP_ALIVE_JOIN_TIMEOUT = 5
+
+# Time, in seconds, to wait before re-adding a watch dropped by etcd after a failure. Doubled after every failed
+# attempt, up to WATCH_RETRY_MAX_INTERVAL.
+WATCH_RETRY_INTERVAL = 1
+
+# Maximum time, in seconds, to wait between attempts to re-add a dropped watch.
+WATCH_RETRY_MAX_INTERVAL = 30
+
+# Maximum number of put transactions in flight at once, per registry.
+MAX_INFLIGHT_TXNS = 8
+
+# Maximum number of encoded etcd3 prefixes kept in cache.
+PREFIX_CACHE_SIZE = 1024
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=PREFIX_CACHE_SIZE)
+def _to_etcd3_prefix(root_key, key):
+    # type: (Key, Key) -> bytes
+    """
+    Create the etcd3 prefix, as bytes, of all children of a given key.
+
+    The etcd3 client accepts bytes as-is; frequently queried prefixes are cached so they are not re-constructed and
+    re-encoded on every query.
+
+    :param root_key: Registry's root key.
+    :param key: Parent key.
+    :return: UTF-8 encoded prefix, e.g.: b'/registry/my_cluster/services/'.
+    """
+    return (root_key.key + key.key + '/').encode('utf-8')
+
+
+def _decode_value(value):
+    # type: (bytes) -> str
+    """
+    Decode a value read from etcd3. The etcd3 client returns values as (UTF-8 encoded) bytes.
+
+    :param value: Value, as returned by the etcd3 client.
+    :return: Decoded value.
+    """
+    return value.decode('utf-8')
+
+
+class _PrefixWatch(object):
+    """
+    A watch on an etcd3 prefix that survives failures.
+
+    etcd3 drops a watch once its stream fails. The watch is then re-added, with exponential backoff, and the callback
+    is issued again once it is re-added, since changes may have been missed in the meantime.
+    """
+
+    __slots__ = ('_client', '_etcd3_key', '_callback', '_lock', '_watch_id', '_retry_timer', '_retry_interval',
+                 '_cancelled')
+
+    def __init__(self, client, etcd3_key, callback):
+        # type: (Etcd3Client, str, Callable[[], None]) -> None
+        """
+        Class initializer.
+
+        :param client: etcd3 client.
+        :param etcd3_key: etcd3 key to watch, along with its children.
+        :param callback: Callback to issue upon changes (and upon failures).
+        """
+        self._client = client  # type: Etcd3Client
+        self._etcd3_key = etcd3_key  # type: str
+        self._callback = callback  # type: Callable[[], None]
+
+        self._lock = Lock()
+        self._watch_id = None  # type: Optional[int]
+        self._retry_timer = None  # type: Optional[Timer]
+        self._retry_interval = WATCH_RETRY_INTERVAL  # type: float
+        self._cancelled = False  # type: bool
+
+    def start(self):
+        # type: () -> None
+        """
+        Add the watch.
+        """
+        self._watch_id = self._client.add_watch_prefix_callback(self._etcd3_key, self.__on_event)
+
+    def cancel(self):
+        # type: () -> None
+        """
+        Cancel the watch, along with a pending attempt to re-add it.
+        """
+        with self._lock:
+            self._cancelled = True
+            if self._retry_timer is not None:
+                self._retry_timer.cancel()
+            watch_id, self._watch_id = self._watch_id, None
+
+        if watch_id is not None:
+            self._client.cancel_watch(watch_id)
+
+    def __on_event(self, response):
+        """
+        Issue the callback upon a watch event.
+
+        :param response: etcd3 watch response, or an exception if the watch failed.
+        """
+        # etcd3 passes an exception object if the watch failed, and drops the watch. Changes may have been missed, so
+        # notify anyway.
+        if isinstance(response, Exception):
+            logger.error("Watch on '{}' failed, re-adding it: {}".format(self._etcd3_key, response))
+            with self._lock:
+                self._watch_id = None
+                self.__schedule_retry()
+
+        self._callback()
+
+    def __schedule_retry(self):
+        # type: () -> None
+        """
+        Schedule an attempt to re-add the watch, unless it was cancelled. Called with the lock held.
+        """
+        if self._cancelled:
+            return
+
+        self._retry_timer = Timer(self._retry_interval, self.__retry)
+        self._retry_timer.daemon = True
+        self._retry_timer.start()
+
+        self._retry_interval = min(self._retry_interval * 2, WATCH_RETRY_MAX_INTERVAL)
+
+    def __retry(self):
+        # type: () -> None
+        """
+        Re-add the watch, scheduling another attempt if it fails.
+        """
+        # noinspection PyBroadException
+        try:
+            watch_id = self._client.add_watch_prefix_callback(self._etcd3_key, self.__on_event)  # type: Optional[int]
+        except Exception:
+            logger.exception("Failed to re-add watch on '{}'.".format(self._etcd3_key))
+            with self._lock:
+                self.__schedule_retry()
+            return
+
+        with self._lock:
+            if not self._cancelled:
+                self._watch_id = watch_id
+                self._retry_interval = WATCH_RETRY_INTERVAL
+                watch_id = None
+
+        if watch_id is not None:
+            # Cancelled while the watch was re-added.
+            self._client.cancel_watch(watch_id)
+            return
+
+        # Changes made while the watch was down were missed.
+        self._callback()
+
+
 class Etcd3Details:
     """
     Data class that holds etcd connection details. Required during initialization of Etcd3ServiceDiscoveryStrategy.
@@ -60,40 +212,29 @@ ETCD_LOCALHOST = Etcd3Details("localhost")
 MAX_SERVICE_CREATION_RETRY_COUNT = 10
 
 
-class _Etcd3KeyValueRecord:
-    """
-    Represents a key and value retrieved from etcd service.
-    """
-
-    def __init__(self, key, key_parts, key_name, value):
-        # type: (str, str,str, str) -> None
-        """
-        Class initializer.
+class Etcd3Registry(Registry):
 
-        The 'key_parts' represents the parts of the key, e.g., '/_etcd/registry/<cluster_id>/services/<service_name>'
-        represented as ['_etcd', 'registry', '<cluster_id>', 'services', '<service_name>'].
+    # Maximum number of operations issued in a single etcd transaction. Must not exceed etcd's '--max-txn-ops'
+    # (128 by default). Unconditional puts of more key/value pairs are split into multiple transactions, each applied
+    # atomically.
+    MAX_TXN_OPS = 64
 
-        :param key: The complete key as a single string.
-        :param key_parts: Key parts, e.g., for '/parent/childA/X' this parameter would be ['parent', 'childA', 'X']
-        :param key_name: The final part of the key, e.g., for ''/parent/childA', this parameter would be 'childA'.
-        :param value: Value.
-        """
-        self.key = key
-        self.key_parts = key_parts
-        self.key_name = key_name
-        self.value = value
+    __slots__ = ('_initialized', '_client', '_lease_ttl', '_lease', '_keep_alive_thread', '_keep_alive_stop_event',
+                 '_txn_executor', '_root_key', '_fetch_children_by_key', '_root_prefix', '_cache', '_cache_generation',
+                 '_cache_lock', '_cache_watch_id')
 
-
-class Etcd3Registry(Registry):
-
-    def __init__(self, details, lease_ttl=DEFAULT_LEASE_TTL, root_key=ROOT_KEY):
-        # type: (Etcd3Details, int, Key) -> None
+    def __init__(self, details, lease_ttl=DEFAULT_LEASE_TTL, root_key=ROOT_KEY, fetch_children_by_key=False):
+        # type: (Etcd3Details, int, Key, bool) -> None
         """
         Class initialization.
 
         :param details: Etcd3 connection properties.
         :param lease_ttl: Lease time to live, in seconds. Default to 12 seconds.
         :param root_key: Base key to use for all etcd3 interactions. All keys will begin with this key.
+        :param fetch_children_by_key: True to fetch the values of immediate children (non-recursive fetch) by first
+                                      listing the keys under the parent and then getting only the immediate children.
+                                      Saves transferring the values of all descendants for deep trees, at the cost
+                                      of an extra round-trip. Defaults to False (a single prefix scan).
         """
         super(Etcd3Registry, self).__init__()
 
@@ -104,32 +245,59 @@ class Etcd3Registry(Registry):
 
         # Flag indicated if this instance is fully initialized and ready for use or not.
         self._initialized = False  # type: bool
-        self._thread = None  # type: Optional[Thread]
-        self._event = None  # type: Optional[Event]
 
-        self._client = etcd3.client(host=details.host, port=details.port)
+        # Clients (and their gRPC channels) are shared among registries connected to the same etcd endpoint.
+        self._client = Etcd3ClientPool.instance().acquire(details.host, details.port)
         self._lease_ttl = lease_ttl  # type: int
 
         # Our lease that keeps all our keys alive.
         self._lease = None  # type: Optional[Lease]
 
-        self._lease_periodic_refresh_timer = None  # type: Optional[PeriodicTimer]
+        # Thread keeping our lease alive over a single keep-alive stream, and the event signaling it to stop.
+        self._keep_alive_thread = None  # type: Optional[Thread]
+        self._keep_alive_stop_event = None  # type: Optional[Event]
+
+        # Executor issuing put transactions concurrently (bounded to MAX_INFLIGHT_TXNS in flight).
+        self._txn_executor = None  # type: Optional[ThreadPoolExecutor]
 
         self._root_key = root_key  # type: Key
+        self._fetch_children_by_key = fetch_children_by_key  # type: bool
+
+        # Prefix shared by all our etcd3 keys, e.g.: '/registry/'. Both the root key and local keys are normalized, so
+        # converting keys from/to etcd3 keys is a plain string concatenation/slicing.
+        self._root_prefix = root_key.key + '/'  # type: str
+
+        # Read-through cache of single keys (etcd3 key -> value), kept up-to-date via a watch on the root key.
+        # The generation counter is incremented on every change, so a value read concurrently with a change is not
+        # cached.
+        self._cache = {}  # type: Dict[str, str]
+        self._cache_generation = 0  # type: int
+        self._cache_lock = Lock()
+        self._cache_watch_id = None  # type: Optional[int]
 
     def setup(self):
         """
-        Register the cluster within etcd if not already registered and initialize periodic lease refresh timer.
+        Register the cluster within etcd if not already registered and start keeping our lease alive.
         """
         self._initialized = False
 
         # Create a new lease that will serve all our registered keys.
         self._lease = self._client.lease(self._lease_ttl + LEASE_TTL_BUFFER)
 
-        # Periodic timer to refresh our lease.
-        self._lease_periodic_refresh_timer = PeriodicTimer(_DEFAULT_LEASE_REFRESH_INTERVAL_SECONDS,
-                                                           self.__periodic_lease_refresh_handler)
-        self._lease_periodic_refresh_timer.start()
+        # Keep our lease alive. A keep-alive request is sent every lease TTL (the lease itself is granted with an extra
+        # buffer) over a single long-lived stream.
+        self._keep_alive_stop_event = Event()
+        self._keep_alive_thread = Thread(target=self.__keep_alive,
+                                         args=(self._lease.id, self._keep_alive_stop_event),
+                                         name="etcd3-lease-keep-alive",
+                                         daemon=True)
+        self._keep_alive_thread.start()
+
+        self._txn_executor = ThreadPoolExecutor(max_workers=MAX_INFLIGHT_TXNS, thread_name_prefix="etcd3-txn")
+
+        # Watch all our keys to keep the read-through cache up-to-date.
+        self._cache_watch_id = self._client.add_watch_prefix_callback(self._root_prefix,
+                                                                      self.__on_cache_watch_event)
         self._initialized = True
 
     def destroy(self):
@@ -139,15 +307,33 @@ class Etcd3Registry(Registry):
         To re-use the service, a user must issue a call to 'setup()'.
 
         """
+        # Signal the keep-alive thread to close its stream. The thread winds down while the rest of the tear-down
+        # (notably, revoking the lease) proceeds; it is joined last.
+        keep_alive_thread = self._keep_alive_thread  # type: Optional[Thread]
+        if keep_alive_thread is not None:
+            self._keep_alive_stop_event.set()
+            self._keep_alive_thread = None
+            self._keep_alive_stop_event = None
+
+        # Let in-flight put transactions complete before revoking the lease they are attached to.
+        if self._txn_executor is not None:
+            self._txn_executor.shutdown(wait=True)
+            self._txn_executor = None
+
         # Revoke our lease so all registered keep will expire.
         if self._lease is not None:
             lease = self._lease
             self._lease = None
             lease.revoke()
 
-        # Stop periodic refresh timer.
-        self._lease_periodic_refresh_timer.stop()
-        self._lease_periodic_refresh_timer = None
+        # Stop watching and drop all cached values.
+        if self._cache_watch_id is not None:
+            self._client.cancel_watch(self._cache_watch_id)
+            self._cache_watch_id = None
+        self.__invalidate_cache()
+
+        if keep_alive_thread is not None:
+            keep_alive_thread.join(LEASE_KEEP_ALIVE_JOIN_TIMEOUT)
 
         self._initialized = False
 
@@ -164,36 +350,44 @@ class Etcd3Registry(Registry):
         """
         etcd3_key = self._to_ectd_key(get_key)
 
-        # all_items = self._client.get_prefix(base_key, sort_order='ascend', sort_target='create')
-        value, metadata = self._client.get(etcd3_key)
+        value = self._cache.get(etcd3_key)  # type: Optional[str]
+        if value is not None:
+            return value
+
+        generation = self._cache_generation  # type: int
+        raw_value, metadata = self._client.get(etcd3_key)
         if metadata is None:
             raise KeyDoesNotExist("Key does not exist: '{}'.".format(get_key.key))
 
+        value = _decode_value(raw_value)
+
+        # Cache the value, unless a change occurred while it was read.
+        if self._cache_watch_id is not None:
+            with self._cache_lock:
+                if generation == self._cache_generation:
+                    self._cache[etcd3_key] = value
+
         return value
 
-    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True):
-        # type: (Key, bool, bool, bool, bool) -> Dict[Key, str]
+    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True, limit=None):
+        # type: (Key, bool, bool, bool, bool, Optional[int]) -> Dict[str, str]
+        if self._fetch_children_by_key and not recursive and not keys_only:
+            return self.__get_by_key(self._list_keys(get_key, keep_order=keep_order, limit=limit))
 
-        etcd3_base_key = self._to_ectd_key(get_key) + '/'  # type: str
+        # Dictionaries retain insertion order, i.e.: the order etcd returned the keys in.
+        return dict(self.__iter_query(get_key, recursive, keep_order, keys_only, limit))
 
-        if keep_order:
-            metadata_list = self._client.get_prefix(etcd3_base_key,
-                                                    keys_only=keys_only,
-                                                    sort_order='ascend',
-                                                    sort_target='create')  # type: Generator[Tuple[str, KVMetadata], None, None]
-            results = OrderedDict()
-        else:
-            metadata_list = self._client.get_prefix(etcd3_base_key,
-                                                    keys_only=keys_only)  # type: Generator[Tuple[str, KVMetadata], None, None]
-            results = dict()
+    def _list_keys(self, parent_key, recursive=False, keep_order=False, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> List[str]
+        # Fetch keys only; values are not transferred.
+        return [key for key, _ in self.__iter_query(parent_key, recursive, keep_order, True, limit)]
 
-        for item in metadata_list:
-            # Generate key from etcd's response.
-            key = self._to_local_key(item[1].key)
-            if recursive or (not recursive and key.is_immediate_parent(get_key)):
-                results[key.key] = item[0]
+    def _iter_get(self, get_key, recursive=False, keep_order=False):
+        # type: (Key, bool, bool) -> Iterator[Tuple[str, str]]
+        if self._fetch_children_by_key and not recursive:
+            return super(Etcd3Registry, self)._iter_get(get_key, recursive, keep_order)
 
-        return results
+        return self.__iter_query(get_key, recursive, keep_order)
 
     def _put(self, kv_list, conditional_key_exist=None):
         # type: (List[Tuple[Key, str]], Optional[Key]) -> bool
@@ -201,36 +395,107 @@ class Etcd3Registry(Registry):
         Set one or more key(s)/value(s).
         The put operation can be condition, i.e., set only if a given key exists.
 
+        Unconditional puts of more than MAX_TXN_OPS pairs are issued as multiple, concurrent, transactions. Each is
+        applied atomically, however, the pairs as a whole are not.
+
         :param kv_list: List of Key/value pair(s).
         :param conditional_key_exist: If defined (non-None), the key/value pairs are set only if the given key does not
                                       exist.
         :return: True if the key/value pairs were set, False otherwise.
         """
-        if len(kv_list) > 1 or conditional_key_exist is not None:
-            # We are either requested to put multiple values or put one or more value under condition.
-            if conditional_key_exist is not None:
-                # Condition to put values only if conditional key exists.
-                conditional_key = [Version(self._to_ectd_key(conditional_key_exist.key)) > 0]
-            else:
-                # All values are put without any condition.
-                conditional_key = []
+        if conditional_key_exist is not None:
+            # Put values only if conditional key does not exist, i.e.: when the comparison (key exists) fails.
+            conditional_key = [Version(self._to_ectd_key(conditional_key_exist)) > 0]
 
             # Construct a list of commands to perform in our transaction.
-            put_commands = [Put(self._to_ectd_key(k.key), v, self._lease) for (k, v) in kv_list]
+            etcd3_keys = self.__to_etcd3_keys(kv_list)  # type: List[str]
+            put_commands = self.__to_put_commands(etcd3_keys, kv_list)
 
             status, responses = self._client.transaction(conditional_key, [], put_commands)
 
             # Values were set if the number of responses is greater than 0 (should be 1 response for each value set).
             success = (len(responses) > 0)  # type: bool
+            if success:
+                self.__evict(etcd3_keys)
+        elif len(kv_list) > self.MAX_TXN_OPS:
+            # Issue the transactions concurrently and wait for all of them (each evicts its keys once applied).
+            for future in self.__put_async(kv_list):
+                future.result()
+
+            success = True  # type: bool
+        elif len(kv_list) > 1:
+            # Put all values in a single transaction.
+            etcd3_keys = self.__to_etcd3_keys(kv_list)  # type: List[str]
+            self.__put_transaction(self.__to_put_commands(etcd3_keys, kv_list), etcd3_keys)
+
+            success = True  # type: bool
         else:
             # We are asked to put only one value. No condition.
             k, v = kv_list[0]
-            self._client.put(self._to_ectd_key(k), v, lease=self._lease)
+            self._put_one(k, v)
 
             success = True  # type: bool
 
         return success
 
+    # noinspection StructuralWrap
+    def put_all_async(self, values):
+        # type: (Union[Dict[Union[Key, str], str], Tuple[Union[Key, str], str], List[Tuple[Union[Key, str], str]]]) -> List[Future]
+        """
+        Set a group of values without waiting for etcd's response.
+
+        Values are split into transactions of at most MAX_TXN_OPS pairs each, issued concurrently (at most
+        MAX_INFLIGHT_TXNS in flight). Each transaction is applied atomically, however, the group as a whole is not.
+
+        :param values: Set of values.
+                       It can be either a dictionary, a single tuple (key/value pair) or a list of
+                       tuples (a set of key/value pairs).
+        :return: List of futures, one for each transaction issued. A future raises if its transaction failed.
+        """
+        return self.__put_async(self._to_tuple_list(values))
+
+    def _put_one(self, k, v):
+        # type: (Key, str) -> None
+        """
+        Set a single key/value pair with a plain put (no transaction).
+
+        :param k: Key to set.
+        :param v: Value to set.
+        """
+        etcd3_key = self._to_ectd_key(k)  # type: str
+        self._client.put(etcd3_key, v, lease=self._lease)
+        self.__evict([etcd3_key])
+
+    def _put_if_not_exist_or_get(self, k, value):
+        # type: (Key, str) -> Tuple[bool, str]
+        """
+        Set a key's value if key is not defined yet, otherwise get its existing value -- in a single transaction.
+
+        :param k: Key to set.
+        :param value: Value to set.
+        :return: A tuple of: True if the key was set, False otherwise, and the key's value.
+        """
+        etcd3_key = self._to_ectd_key(k)  # type: str
+
+        # If the key exists, the comparison succeeds and the existing value is read. Otherwise, the value is put.
+        key_exists, responses = self._client.transaction([Version(etcd3_key) > 0],
+                                                         [Get(etcd3_key)],
+                                                         [Put(etcd3_key, value, self._lease)])
+        if key_exists:
+            # Response of our get command: a list holding a single (value, metadata) pair.
+            existing_value, _ = responses[0][0]
+            return False, _decode_value(existing_value)
+
+        self.__evict([etcd3_key])
+        return True, value
+
+    def _watch_prefix(self, watch_key, callback):
+        # type: (Key, Callable[[], None]) -> Callable[[], None]
+        watch = _PrefixWatch(self._client, self._to_ectd_key(watch_key), callback)  # type: _PrefixWatch
+        watch.start()
+
+        return watch.cancel
+
     def _to_local_key(self, key):
         # type: (str) -> Key
         """
@@ -240,12 +505,10 @@ class Etcd3Registry(Registry):
         :param key: Key to convert.
         :return: Localized key.
         """
-        local_key = Key.create(key)
-
-        if not local_key.is_a_parent(self._root_key):
+        if not key.startswith(self._root_prefix):
             raise KeyError("Invalid/unsupported etcd3 key: '{}' (must start with '{}').".format(key, self._root_key))
 
-        return local_key.remove_parent(self._root_key)
+        return Key.create(key[len(self._root_key.key):])
 
     # noinspection SpellCheckingInspection
     def _to_ectd_key(self, key):
@@ -253,20 +516,223 @@ class Etcd3Registry(Registry):
         """
         Convert a caller's key to an ECTD key.
 
-        The key is converted for prefixing the key with our local _ROOT_KEY and normalizing it afterward.
+        The key is converted by prefixing the key with our root key. Both keys are already normalized.
         :param key: Key to be converted.
         :return: Compatible internal etcd key.
         """
-        return self._root_key.relative(key).key
+        return self._root_key.key + key.key
+
+    def __put_async(self, kv_list):
+        # type: (List[Tuple[Key, str]]) -> List[Future]
+        """
+        Issue unconditional put transactions of at most MAX_TXN_OPS commands each, concurrently.
+
+        :param kv_list: List of Key/value pair(s).
+        :return: List of futures, one for each transaction issued.
+        """
+        assert self._txn_executor is not None, "Registry is not set up."
 
-    def __periodic_lease_refresh_handler(self):
+        etcd3_keys = self.__to_etcd3_keys(kv_list)  # type: List[str]
+        put_commands = self.__to_put_commands(etcd3_keys, kv_list)
+
+        return [self._txn_executor.submit(self.__put_transaction,
+                                          put_commands[index:index + self.MAX_TXN_OPS],
+                                          etcd3_keys[index:index + self.MAX_TXN_OPS])
+                for index in range(0, len(put_commands), self.MAX_TXN_OPS)]
+
+    def __put_transaction(self, put_commands, etcd3_keys):
+        # type: (List[Put], List[str]) -> None
+        """
+        Issue an unconditional put transaction, and evict the keys it set from the read-through cache.
+
+        :param put_commands: Put commands.
+        :param etcd3_keys: The etcd3 keys set by the commands.
+        """
+        self._client.transaction([], put_commands, [])
+        self.__evict(etcd3_keys)
+
+    def __to_etcd3_keys(self, kv_list):
+        # type: (List[Tuple[Key, str]]) -> List[str]
+        """
+        Convert the keys of given key/value pairs to etcd3 keys.
+
+        :param kv_list: List of Key/value pair(s).
+        :return: List of etcd3 keys, in the order of the pairs.
+        """
+        root = self._root_key.key  # type: str
+        return [root + k.key for k, _ in kv_list]
+
+    def __to_put_commands(self, etcd3_keys, kv_list):
+        # type: (List[str], List[Tuple[Key, str]]) -> List[Put]
+        """
+        Construct put commands, attached to our lease, for given key/value pairs.
+
+        The lease is bound to a local once, outside the comprehension.
+
+        :param etcd3_keys: The etcd3 keys of the pairs (see '__to_etcd3_keys').
+        :param kv_list: List of Key/value pair(s).
+        :return: List of put commands.
+        """
+        lease = self._lease  # type: Optional[Lease]
+        return [Put(etcd3_key, v, lease) for etcd3_key, (_, v) in zip(etcd3_keys, kv_list)]
+
+    def __get_by_key(self, keys):
+        # type: (List[str]) -> Dict[str, str]
+        """
+        Fetch the values of given keys, in transactions of at most MAX_TXN_OPS gets each, issued concurrently.
+
+        Keys deleted in the meantime are omitted from the result.
+
+        :param keys: Local keys to fetch.
+        :return: A dictionary of keys and their values, in the order of the given keys.
+        """
+        assert self._txn_executor is not None, "Registry is not set up."
+
+        root = self._root_key.key  # type: str
+        get_commands = [Get(root + key) for key in keys]
+        futures = [self._txn_executor.submit(self._client.transaction,
+                                             [], get_commands[index:index + self.MAX_TXN_OPS], [])
+                   for index in range(0, len(get_commands), self.MAX_TXN_OPS)]
+
+        # Each transaction response holds a list of (value, metadata) pairs for each get -- empty if key is missing.
+        root_length = len(self._root_key.key)  # type: int
+        return {metadata.key.decode('utf-8')[root_length:]: _decode_value(value)
+                for future in futures
+                for response in future.result()[1]
+                for value, metadata in response}
+
+    def __iter_query(self, parent_key, recursive=False, keep_order=False, keys_only=False, limit=None):
+        # type: (Key, bool, bool, bool, Optional[int]) -> Generator[Tuple[str, str], None, None]
+        """
+        Query etcd for the children of a given key, yielding local keys and values in a single pass over etcd's
+        response.
+
+        :param parent_key: Parent key to fetch children for.
+        :param recursive: True to fetch children at all levels, False to fetch only immediate children.
+        :param keep_order: True to fetch children in order of creation, False for any order.
+        :param keys_only: True to fetch keys only (yielded values are empty strings), False to fetch values as well.
+        :param limit: Maximum number of pairs to yield, or None for no limit.
+        :return: A generator of (local key, value) pairs.
+        """
+        # All returned keys start with our root key, so local keys are sliced directly off etcd's response.
+        # Immediate children are one level deeper than the parent key, i.e.: have one more forward slash.
+        root_length = len(self._root_key.key)  # type: int
+        depth = parent_key.key.count('/') + 1  # type: int
+
+        # When recursive, every key etcd returns is yielded, so etcd can limit the response itself. Otherwise, deeper
+        # keys are filtered out here, after the response is limited.
+        metadata_list = self.__query(parent_key, keep_order, keys_only, limit if recursive else None)
+
+        yielded = 0  # type: int
+        for value, metadata in metadata_list:
+            key = metadata.key.decode('utf-8')[root_length:]  # type: str
+            if recursive or key.count('/') == depth:
+                # Values were not fetched if only keys were requested.
+                yield key, '' if keys_only else _decode_value(value)
+
+                yielded += 1
+                if yielded == limit:
+                    return
+
+    def __query(self, parent_key, keep_order=False, keys_only=False, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> Generator[Tuple[bytes, KVMetadata], None, None]
+        """
+        Query etcd for all children of a given key.
+
+        :param parent_key: Parent key to fetch children for.
+        :param keep_order: True to fetch children in order of creation, False for any order.
+        :param keys_only: True to fetch keys only (values are not transferred), False to fetch values as well.
+        :param limit: Maximum number of keys etcd should return (bounds the range request server-side), or None for
+                      no limit.
+        :return: A generator of (value, metadata) pairs, as returned by the etcd3 client.
+        """
+        etcd3_base_key = _to_etcd3_prefix(self._root_key, parent_key)  # type: bytes
+
+        if keep_order:
+            return self._client.get_prefix(etcd3_base_key,
+                                           keys_only=keys_only,
+                                           limit=limit,
+                                           sort_order='ascend',
+                                           sort_target='create')
+
+        return self._client.get_prefix(etcd3_base_key, keys_only=keys_only, limit=limit)
+
+    def __on_cache_watch_event(self, response):
+        """
+        Evict changed keys from the read-through cache.
+
+        :param response: etcd3 watch response, or an exception if the watch failed.
+        """
+        if isinstance(response, Exception):
+            # The watch is broken; we can no longer tell which values are up-to-date. Stop caching.
+            logger.error("Cache watch failed, disabling read-through cache: {}".format(response))
+            self._cache_watch_id = None
+            self.__invalidate_cache()
+            return
+
+        with self._cache_lock:
+            self._cache_generation += 1
+            for event in response.events:
+                self._cache.pop(event.key.decode('utf-8'), None)
+
+    def __evict(self, etcd3_keys):
+        # type: (List[str]) -> None
+        """
+        Evict keys this registry has just set from the read-through cache, so subsequent reads observe the new values
+        without waiting for the watch event.
+
+        :param etcd3_keys: The etcd3 keys that were set.
+        """
+        with self._cache_lock:
+            self._cache_generation += 1
+            for key in etcd3_keys:
+                self._cache.pop(key, None)
+
+    def __invalidate_cache(self):
         # type: () -> None
         """
-        Refresh our lease periodically.
+        Drop all cached values.
         """
-        if self._lease is not None:
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._cache.clear()
+
+    def __keep_alive(self, lease_id, stop_event):
+        # type: (int, Event) -> None
+        """
+        Keep a lease alive until signaled to stop.
+
+        Keep-alive requests and responses flow over a single LeaseKeepAlive stream. If the stream fails, it is
+        re-opened.
+
+        :param lease_id: Identifier of the lease to keep alive.
+        :param stop_event: Event signaling the thread to stop.
+        """
+        while not stop_event.is_set():
             # noinspection PyBroadException
             try:
-                self._lease.refresh()
-            except:
-                logger.exception("Failed to refresh lease {}".format(self._lease.id))
+                responses = self._client.leasestub.LeaseKeepAlive(self.__keep_alive_requests(lease_id, stop_event),
+                                                                  credentials=self._client.call_credentials,
+                                                                  metadata=self._client.metadata)
+                for response in responses:
+                    # The lease may be revoked while the stream is closing.
+                    if response.TTL <= 0 and not stop_event.is_set():
+                        logger.error("Lease {} has expired.".format(lease_id))
+            except Exception:
+                if stop_event.is_set():
+                    break
+                logger.exception("Lease keep-alive stream failed (lease {}).".format(lease_id))
+                stop_event.wait(LEASE_KEEP_ALIVE_RETRY_INTERVAL)
+
+    def __keep_alive_requests(self, lease_id, stop_event):
+        # type: (int, Event) -> Generator[etcdrpc.LeaseKeepAliveRequest, None, None]
+        """
+        Generate a keep-alive request every lease TTL, until signaled to stop.
+        Returning from the generator closes the request side of the keep-alive stream.
+
+        :param lease_id: Identifier of the lease to keep alive.
+        :param stop_event: Event signaling to stop.
+        """
+        while not stop_event.is_set():
+            yield etcdrpc.LeaseKeepAliveRequest(ID=lease_id)
+            stop_event.wait(self._lease_ttl)
@@ -1,53 +1,99 @@
 import logging
-from collections import OrderedDict
+from itertools import count, islice
 
-from typing import List, Dict, Union, Tuple, Optional
+from sortedcontainers import SortedDict
+from typing import List, Dict, Union, Tuple, Optional, Iterator
 
-from scoutlight.registry import Registry, KeyDoesNotExist, Key
-from scoutlight.tools.key_tools import normalize_key, starts_with
+from scoutlight.registry import LocalRegistry, KeyDoesNotExist, Key
 
 logger = logging.getLogger(__name__)
 
 
-class InMemoryRegistry(Registry):
+class InMemoryRegistry(LocalRegistry):
 
     def __init__(self):
         super(InMemoryRegistry, self).__init__()
 
-        # Holds all key/value mappings.
-        self._model = OrderedDict()  # type: Dict[Key, str]
+        # Holds all key/value mappings, sorted by key, so all children of a key form a contiguous range.
+        self._model = SortedDict()  # type: Dict[str, str]
+
+        # Creation sequence number of each key, used when a caller asks to keep the order of creation.
+        self._creation_order = {}  # type: Dict[str, int]
+        self._creation_counter = count()  # type: Iterator[int]
 
     def _put(self, kv_list, conditional_key_exist=None):
         # type: (List[Tuple[Key, str]], Optional[Key, str]) -> bool
         # If we got conditional key, we need to check if it exists.
-        if conditional_key_exist is not None and conditional_key_exist in self._model:
+        if conditional_key_exist is not None and conditional_key_exist.key in self._model:
             return False
 
         for key, value in kv_list:
-            self._model[key] = value
+            self.__set(key.key, value)
+
+        self._notify_watches(kv_list)
 
         return True
 
+    def _put_one(self, k, v):
+        # type: (Key, str) -> None
+        self.__set(k.key, v)
+        self._notify_watches([(k, v)])
+
     def _get_one(self, get_key):
         # type: (Key) -> str
-        if get_key not in self._model:
+        try:
+            return self._model[get_key.key]
+        except KeyError:
             raise KeyDoesNotExist("Key not found -- {}".format(get_key.key))
 
-        return self._model[get_key]
-
-    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True):
-        # type: (Key, bool, bool, bool, bool) -> Dict[str, str]
-
-        result = OrderedDict() # type: Dict[str,str]
-        for key, value in self._model.items():
-            if keys_only:
-                value = ''
-            if not recursive and key.is_immediate_parent(get_key):
-                result[key.key] = value
-            elif recursive and key.is_a_parent(get_key):
-                result[key.key] = value
-
-        if exclude_parent_keys:
-            result.pop(get_key.key, None)
-
-        return result
+    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True, limit=None):
+        # type: (Key, bool, bool, bool, bool, Optional[int]) -> Dict[str, str]
+        keys = self.__children(get_key, recursive, keep_order, limit)  # type: List[str]
+
+        if keys_only:
+            return dict.fromkeys(keys, '')
+
+        return {key: self._model[key] for key in keys}
+
+    def _list_keys(self, parent_key, recursive=False, keep_order=False, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> List[str]
+        return self.__children(parent_key, recursive, keep_order, limit)
+
+    def __set(self, key, value):
+        # type: (str, str) -> None
+        """
+        Set a key's value, recording the key's creation order if it is a new key.
+        """
+        if key not in self._creation_order:
+            self._creation_order[key] = next(self._creation_counter)
+        self._model[key] = value
+
+    def __children(self, parent_key, recursive, keep_order, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> List[str]
+        """
+        Find the children keys of a given parent key.
+
+        All children share the prefix '<parent key>/', so they are found with a range scan over the sorted model:
+        from the prefix (inclusive) up to '<parent key>0' (exclusive; '0' follows '/').
+
+        :param parent_key: Parent key.
+        :param recursive: True to find children at all levels, False to find only immediate children.
+        :param keep_order: True to sort the children by creation order, False to return them sorted by key.
+        :param limit: Maximum number of children to return (the first ones, in the requested order), or None for no
+                      limit.
+        :return: List of children keys.
+        """
+        prefix = parent_key.key + '/'  # type: str
+        keys = self._model.irange(prefix, parent_key.key + '0', inclusive=(True, False))
+
+        if not recursive:
+            # Immediate children have no forward slash past the prefix.
+            prefix_length = len(prefix)  # type: int
+            keys = (key for key in keys if key.find('/', prefix_length) < 0)
+
+        if keep_order:
+            # All children must be sorted before the first ones can be picked.
+            children = sorted(keys, key=self._creation_order.__getitem__)  # type: List[str]
+            return children if limit is None else children[:limit]
+
+        return list(islice(keys, limit))
@@ -1,7 +1,14 @@
-from typing import List, Union
+import sys
+from functools import lru_cache
+
+from typing import Tuple, Union, Sequence, Optional
 
 from scoutlight.exceptions import DiscoveryException
-from scoutlight.tools.key_tools import normalize_key, construct_key
+from scoutlight.tools.key_tools import normalize_key
+
+
+# Maximum number of Key objects kept in cache by Key.create.
+KEY_CACHE_SIZE = 4096
 
 
 class KeyException(DiscoveryException):
@@ -22,8 +29,11 @@ class Key(object):
     The __init__ may change over time, however, the Key.create(...) will retain its signature.
     """
 
+    # Keys are created in large numbers (and cached); avoid a per-instance __dict__.
+    __slots__ = ('_key', '_key_parts')
+
     def __init__(self, key, key_parts):
-        # type: (str, List[str]) -> None
+        # type: (str, Tuple[str, ...]) -> None
         """
         Class initializer.
 
@@ -31,18 +41,34 @@ class Key(object):
         :param key_parts: All key parts.
         """
         self._key = key  # type: str
-        self._key_parts = key_parts  # type: List[str]
+        self._key_parts = key_parts  # type: Tuple[str, ...]
 
     @classmethod
     def create(cls, key):
         """
         Factory method for creating a new Key object. This is the preferred way of creating a Key object.
 
+        Keys are immutable, so repeated calls with the same string return the same (cached) Key object.
+
         :param key: The key string to create a new Key object.
         :return: The new Key object.
         """
-        key = normalize_key(key)
-        return Key(key, key.split('/')[1:])
+        return _create_key(key)
+
+    @classmethod
+    def _from_parts(cls, key_parts, key=None):
+        # type: (Sequence[str], Optional[str]) -> Key
+        """
+        Create a new Key object from parts that are known to be normalized (e.g.: parts of another key), skipping
+        normalization.
+
+        :param key_parts: Key parts.
+        :param key: The key string matching the given parts, if already known. Otherwise, it's joined from the parts.
+        :return: The new Key object.
+        """
+        if key is None:
+            key = '/' + '/'.join(key_parts) if key_parts else ''
+        return Key(key, tuple(key_parts))
 
     @property
     def key(self):
@@ -52,6 +78,14 @@ class Key(object):
         """
         return self._key
 
+    @property
+    def key_parts(self):
+        # type: () -> Tuple[str, ...]
+        """
+        :return: The parts of the key.
+        """
+        return self._key_parts
+
     @property
     def key_length(self):
         # type: () -> int
@@ -64,9 +98,13 @@ class Key(object):
         # type: () -> Key
         """
         :return: The parent key of this key.
+        :raises KeyException: If this is the root key.
         """
-        parent = self._key_parts[:-1]  # type: List[str]
-        return Key(construct_key(parent), parent)
+        if not self._key_parts:
+            raise KeyException("The root key has no parent.")
+
+        # Our key is normalized, so the parent key is everything up to the last forward slash.
+        return Key._from_parts(self._key_parts[:-1], self._key.rsplit('/', 1)[0])
 
     def relative(self, relative_path):
         # type: (Union[Key, str]) -> Key
@@ -79,15 +117,14 @@ class Key(object):
         :param relative_path: A relative key, which may be either a string or another key.
         :return: A new Key object.
         """
-        all_parts = list(self._key_parts)
-        if isinstance(relative_path, basestring):
-            all_parts.append(relative_path)
-        elif isinstance(relative_path, Key):
-            all_parts.extend(relative_path._key_parts)
+        if isinstance(relative_path, Key):
+            # Both keys are already normalized.
+            return Key._from_parts(self._key_parts + relative_path._key_parts)
+        elif isinstance(relative_path, str):
+            # Only the (untrusted) relative path is normalized, via the cached factory.
+            return Key._from_parts(self._key_parts + Key.create(relative_path)._key_parts)
         else:
             raise TypeError("Unsupported type: {} (must be either string or Key).".format(type(relative_path)))
-        new_key = construct_key(*all_parts)  # type: str
-        return Key.create(new_key)
 
     def is_a_parent(self, parent):
         # type: (Key) -> bool
@@ -102,7 +139,8 @@ class Key(object):
         """
         assert isinstance(parent, Key), "Parameter must be of type 'Key'."
 
-        return parent.key_length < self.key_length and self.__starts_with(parent._key_parts)
+        parent_length = len(parent._key_parts)  # type: int
+        return parent_length < len(self._key_parts) and self._key_parts[:parent_length] == parent._key_parts
 
     def is_immediate_parent(self, parent):
         # type: (Key) -> bool
@@ -116,7 +154,7 @@ class Key(object):
         :param parent: Key to test as a parent key.
         :return: True if this key is an immediate parent of this key, False otherwise.
         """
-        return self.is_a_parent(parent) and ((self.key_length - 1) == parent.key_length)
+        return len(self._key_parts) - 1 == len(parent._key_parts) and self._key_parts[:-1] == parent._key_parts
 
     def remove_parent(self, parent_key):
         # type: (Key) -> Key
@@ -133,8 +171,7 @@ class Key(object):
         if not self.is_a_parent(parent_key):
             raise KeyException("Parent key '{}' is not a parent of this key ('{}').".format(parent_key._key, self._key))
 
-        new_key = construct_key(*self._key_parts[parent_key.key_length:])
-        return Key.create(new_key)
+        return Key._from_parts(self._key_parts[parent_key.key_length:])
 
     def __str__(self):
         # type: () -> str
@@ -159,19 +196,25 @@ class Key(object):
         """
         return isinstance(other, Key) and other._key == self._key
 
-    def __starts_with(self, sub_key_parts):
-        # type: (List[str]) -> bool
+    def __hash__(self):
+        # type: () -> int
         """
-        Test if this key starts with sub_key_parts.
-
-        :param sub_key_parts: Subkey to test.
-        :return: True if this key starts with sub_key_parts, otherwise False.
+        :return: Hash code of this key, consistent with __eq__.
         """
-        if len(sub_key_parts) > len(self._key_parts):
-            return False
+        return hash(self._key)
+
 
-        for index in range(len(sub_key_parts)):
-            if sub_key_parts[index] != self._key_parts[index]:
-                return False
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _create_key(key):
+    # type: (str) -> Key
+    """
+    Create a new Key object from a string. Results are cached, as keys are immutable.
 
-        return True
+    The key and its parts are interned: parts repeat across many keys (e.g.: 'services', service names), so keys share
+    a single copy of each, and comparing them short-circuits on identity.
+
+    :param key: The key string to create a new Key object.
+    :return: The new Key object.
+    """
+    key = sys.intern(normalize_key(key))
+    return Key(key, tuple(map(sys.intern, key.split('/')[1:])))
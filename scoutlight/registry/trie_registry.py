@@ -0,0 +1,229 @@
+from itertools import islice
+
+from typing import List, Dict, Tuple, Optional, Iterator
+
+from scoutlight.registry import LocalRegistry, KeyDoesNotExist, Key
+
+
+class _TrieNode:
+    """
+    A node in the registry's trie, representing a single key part.
+
+    A node may exist without a value, e.g.: when only its children were set.
+    """
+
+    __slots__ = ('key', 'children', 'value', 'order')
+
+    def __init__(self, key):
+        # type: (str) -> None
+        """
+        Class initializer.
+
+        :param key: The complete key this node represents.
+        """
+        self.key = key  # type: str
+        self.children = {}  # type: Dict[str, _TrieNode]
+        self.value = None  # type: Optional[str]
+        self.order = -1  # type: int
+
+
+class TrieRegistry(LocalRegistry):
+    """
+    An in-memory registry that indexes keys in a trie of key parts.
+
+    Finding the children of a key descends the trie one part at a time, so queries are proportional to the size of
+    the parent key and the result, regardless of the number of keys in the registry.
+    """
+
+    def __init__(self):
+        super(TrieRegistry, self).__init__()
+
+        # Root of the trie, representing the root (empty) key.
+        self._root = _TrieNode('')  # type: _TrieNode
+
+        # Creation sequence number of the next new key, used when a caller asks to keep the order of creation.
+        self._creation_sequence = 0  # type: int
+
+    def _put(self, kv_list, conditional_key_exist=None):
+        # type: (List[Tuple[Key, str]], Optional[Key]) -> bool
+        # If we got conditional key, we need to check if it exists.
+        if conditional_key_exist is not None:
+            node = self.__find(conditional_key_exist)  # type: Optional[_TrieNode]
+            if node is not None and node.value is not None:
+                return False
+
+        if len(kv_list) > 1:
+            self.__set_all(kv_list)
+        else:
+            for key, value in kv_list:
+                self.__set(key, value)
+
+        self._notify_watches(kv_list)
+
+        return True
+
+    def _put_one(self, k, v):
+        # type: (Key, str) -> None
+        self.__set(k, v)
+        self._notify_watches([(k, v)])
+
+    def _get_one(self, get_key):
+        # type: (Key) -> str
+        node = self.__find(get_key)  # type: Optional[_TrieNode]
+        if node is None or node.value is None:
+            raise KeyDoesNotExist("Key not found -- {}".format(get_key.key))
+
+        return node.value
+
+    def _get(self, get_key, recursive=False, keep_order=False, keys_only=False, exclude_parent_keys=True, limit=None):
+        # type: (Key, bool, bool, bool, bool, Optional[int]) -> Dict[str, str]
+        nodes = self.__children(get_key, recursive, keep_order, limit)  # type: List[_TrieNode]
+
+        if keys_only:
+            return {node.key: '' for node in nodes}
+
+        return {node.key: node.value for node in nodes}
+
+    def _list_keys(self, parent_key, recursive=False, keep_order=False, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> List[str]
+        return [node.key for node in self.__children(parent_key, recursive, keep_order, limit)]
+
+    def _iter_get(self, get_key, recursive=False, keep_order=False):
+        # type: (Key, bool, bool) -> Iterator[Tuple[str, str]]
+        # Keys and values are yielded as the trie is walked (unless sorted by creation order).
+        return ((node.key, node.value) for node in self.__iter_children(get_key, recursive, keep_order))
+
+    def __find(self, key):
+        # type: (Key) -> Optional[_TrieNode]
+        """
+        Find the node of a given key.
+
+        :param key: Key to find.
+        :return: The key's node, or None if there is no such node.
+        """
+        node = self._root  # type: Optional[_TrieNode]
+        for part in key.key_parts:
+            node = node.children.get(part)
+            if node is None:
+                break
+
+        return node
+
+    def __set(self, key, value):
+        # type: (Key, str) -> None
+        """
+        Set a key's value, creating its node (and any missing parent nodes) and recording the key's creation order if
+        it is a new key.
+        """
+        node = self._root  # type: _TrieNode
+        for part in key.key_parts:
+            child = node.children.get(part)  # type: Optional[_TrieNode]
+            if child is None:
+                child = node.children[part] = _TrieNode(node.key + '/' + part)
+            node = child
+
+        if node.value is None:
+            node.order = self._creation_sequence
+            self._creation_sequence += 1
+        node.value = value
+
+    def __set_all(self, kv_list):
+        # type: (List[Tuple[Key, str]]) -> None
+        """
+        Set the values of multiple keys, recording the creation order of new keys in the given order.
+
+        Keys are inserted sorted by their parts, so consecutive keys share a prefix: each key descends from the deepest
+        node shared with the previous key, rather than from the root.
+
+        :param kv_list: Key/value pairs.
+        """
+        # The sort is stable; a key given more than once keeps its last value.
+        indexed_pairs = sorted(enumerate(kv_list), key=lambda indexed_pair: indexed_pair[1][0].key_parts)
+        sequence = self._creation_sequence  # type: int
+
+        # Nodes along the previous key's path; path[i] is the node of the previous key's first i parts.
+        path = [self._root]  # type: List[_TrieNode]
+        previous_parts = ()  # type: Tuple[str, ...]
+
+        for index, (key, value) in indexed_pairs:
+            parts = key.key_parts
+
+            # Length of the prefix shared with the previous key.
+            shared = 0  # type: int
+            for part, previous_part in zip(parts, previous_parts):
+                if part != previous_part:
+                    break
+                shared += 1
+
+            del path[shared + 1:]
+            node = path[-1]  # type: _TrieNode
+            for part in parts[shared:]:
+                child = node.children.get(part)  # type: Optional[_TrieNode]
+                if child is None:
+                    child = node.children[part] = _TrieNode(node.key + '/' + part)
+                node = child
+                path.append(node)
+
+            if node.value is None:
+                node.order = sequence + index
+            node.value = value
+            previous_parts = parts
+
+        self._creation_sequence = sequence + len(kv_list)
+
+    def __children(self, parent_key, recursive, keep_order, limit=None):
+        # type: (Key, bool, bool, Optional[int]) -> List[_TrieNode]
+        """
+        Find the nodes of the children keys of a given parent key.
+
+        :param parent_key: Parent key.
+        :param recursive: True to find children at all levels, False to find only immediate children.
+        :param keep_order: True to sort the children by creation order, False to return them in any order.
+        :param limit: Maximum number of children to return (the first ones, in the requested order), or None for no
+                      limit.
+        :return: List of children nodes (nodes with a value only).
+        """
+        children = self.__iter_children(parent_key, recursive, keep_order)  # type: Iterator[_TrieNode]
+        if keep_order and limit is not None:
+            # Children are already sorted (as a list).
+            return children[:limit]
+
+        return list(islice(children, limit))
+
+    def __iter_children(self, parent_key, recursive, keep_order):
+        # type: (Key, bool, bool) -> Iterator[_TrieNode]
+        """
+        Iterate over the nodes of the children keys of a given parent key.
+
+        :param parent_key: Parent key.
+        :param recursive: True to find children at all levels, False to find only immediate children.
+        :param keep_order: True to sort the children by creation order, False to iterate them in any order.
+        :return: An iterator of children nodes (nodes with a value only). A list, if sorted by creation order.
+        """
+        parent = self.__find(parent_key)  # type: Optional[_TrieNode]
+        if parent is None:
+            return iter(())
+
+        nodes = self.__descendants(parent) if recursive else iter(parent.children.values())
+        nodes = (node for node in nodes if node.value is not None)
+
+        if keep_order:
+            # All children must be collected before they can be sorted.
+            return sorted(nodes, key=lambda n: n.order)
+
+        return nodes
+
+    @staticmethod
+    def __descendants(node):
+        # type: (_TrieNode) -> Iterator[_TrieNode]
+        """
+        Iterate over all descendants of a given node, depth-first.
+
+        :param node: Node to iterate the descendants of.
+        :return: An iterator of nodes.
+        """
+        stack = list(node.children.values())  # type: List[_TrieNode]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children.values())
@@ -21,7 +21,7 @@ def is_none_or_str(obj):
     :param obj: Object to test.
     :return: True if 'obj' is None or a string, False otherwise.
     """
-    return is_none_or_instance(obj, basestring)
+    return obj is None or isinstance(obj, str)
 
 
 def assert_none_or_string(obj, parameter_name):
@@ -1,11 +1,18 @@
+from typing import Dict, Tuple
+
 from scoutlight.registry import Key
 
+# Maximum number of service instance keys each ClusterKeys object keeps in cache.
+SERVICE_INSTANCE_CACHE_SIZE = 4096
+
 
 class ClusterKeys(object):
     """
     ClusterKeys object allows easy access to common cluster keys, such as base key, services keys, etc...
     """
 
+    __slots__ = ('_cluster_id', '_cluster_base_key', '_services_key', '_service_key_cache', '_service_instance_cache')
+
     def __init__(self, cluster_id):
         # type: (str) -> None
 
@@ -20,6 +27,10 @@ class ClusterKeys(object):
         # Services' base key.
         self._services_key = self._cluster_base_key.relative('services')  # type: Key
 
+        # Keys already created for services and service instances.
+        self._service_key_cache = {}  # type: Dict[str, Key]
+        self._service_instance_cache = {}  # type: Dict[Tuple[str, str], Key]
+
     def cluster_key(self):
         # type: () -> Key
         """
@@ -42,11 +53,15 @@ class ClusterKeys(object):
         :param service_name: The name of the service.
         :return: Key to the service.
         """
-        assert isinstance(service_name, str), "Service name must be a string."
-        return self._services_key.relative(service_name)
+        key = self._service_key_cache.get(service_name)
+        if key is None:
+            # Key.relative rejects non-string names.
+            key = self._service_key_cache[service_name] = self._services_key.relative(service_name)
+
+        return key
 
     def service_instance(self, service_name, instance_id):
-        # type (str, str) -> Key
+        # type: (str, str) -> Key
         """
         Return a key to a service instance, typically '/<cluster_id>/services/<service_name>/<instance_id>'.
 
@@ -54,4 +69,13 @@ class ClusterKeys(object):
         :param instance_id: Service instance id.
         :return: Key to the service instance.
         """
-        return self._services_key.relative(service_name, instance_id)
+        key = self._service_instance_cache.get((service_name, instance_id))
+        if key is None:
+            # Instances come and go; keep the cache bounded by starting over once full.
+            if len(self._service_instance_cache) >= SERVICE_INSTANCE_CACHE_SIZE:
+                self._service_instance_cache.clear()
+
+            key = self.service_key(service_name).relative(instance_id)
+            self._service_instance_cache[(service_name, instance_id)] = key
+
+        return key
@@ -1,14 +1,13 @@
-import uuid
-from abc import ABCMeta
+import os
+from abc import ABCMeta, abstractmethod
 
 
-class IdentifierGenerator:
+class IdentifierGenerator(metaclass=ABCMeta):
     """
     An abstraction for generating identifiers.
     """
 
-    __metaclass__ = ABCMeta
-
+    @abstractmethod
     def generate(self):
         # type: () -> str
         """
@@ -16,7 +15,7 @@ class IdentifierGenerator:
 
         :return: String identifier.
         """
-        raise NotImplementedError()
+        ...
 
 
 class UUID4IdentifierGenerator(IdentifierGenerator):
@@ -29,4 +28,8 @@ class UUID4IdentifierGenerator(IdentifierGenerator):
         """
         :return A UUID4 string.
         """
-        return uuid.uuid4().hex
+        # Same as uuid.uuid4().hex, without constructing a UUID object.
+        b = bytearray(os.urandom(16))
+        b[6] = (b[6] & 0x0F) | 0x40  # Version 4.
+        b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant.
+        return b.hex()
@@ -1,3 +1,6 @@
+from typing import List, Sequence
+
+
 def normalize_key(key):
     # type: (str) -> str
     """
@@ -9,23 +12,29 @@ def normalize_key(key):
     :return: Normalized key.
     """
     assert isinstance(key, str), "Key must be a string."
+    return _normalize_key_fast(key)
 
-    # Trim leading/trailing spaces. Valid key does not start or end with spaces.
-    key = key.strip()
 
-    # Valid key must always start with forward slash.
-    if not key.startswith("/"):
-        key = "/" + key
+def _normalize_key_fast(key):
+    # type: (str) -> str
+    """
+    Normalize a given string as a key (see normalize_key), without validating it. For internal callers that already
+    validated their input.
 
-    # Key must never end with forward slash.
-    while key.endswith("/"):
-        key = key[:-1]
+    :param key: Key to normalize.
+    :return: Normalized key.
+    """
+    # Most keys are already normalized (e.g.: built from other keys): return them as they are, after a few C-level
+    # checks, without splitting and re-joining.
+    if key[:1] == '/' and key[-1] != '/' and not key[-1].isspace() and '//' not in key:
+        return key
 
-    # Remove any duplicate forward slashes in the key.
-    while '//' in key:
-        key = key.replace('//', '/')
+    # Trim leading/trailing spaces (valid key does not start or end with spaces) and split to parts in a single pass.
+    # Empty parts stem from leading, trailing or duplicate forward slashes, and are dropped.
+    parts = [part for part in key.strip().split('/') if part]  # type: List[str]
 
-    return key
+    # Valid key always starts with a forward slash (the root key is an empty string).
+    return '/' + '/'.join(parts) if parts else ''
 
 
 def construct_key(*args):
@@ -36,25 +45,18 @@ def construct_key(*args):
     :param args: List of strings.
     :return: New key.
     """
-    for arg in args:
-        assert isinstance(arg, basestring), "All key parts must be strings."
+    assert all(isinstance(arg, str) for arg in args), "All key parts must be strings."
 
-    key = "/".join(args)
-    return normalize_key(key)
+    return _normalize_key_fast("/".join(args))
 
 
-def starts_with(key, sub_key):
+def parts_start_with(key_parts, sub_key_parts):
+    # type: (Sequence[str], Sequence[str]) -> bool
     """
-    Test if key starts with sub_key.
+    Test if a key's parts start with the parts of a sub key.
 
-    :param key: Key to test.
-    :param sub_key: Subkey to test.
-    :return: True if key starts with sub_key, otherwise False.
+    :param key_parts: Parts of the key to test, e.g.: ('my', 'service', 'demo').
+    :param sub_key_parts: Parts of the subkey to test, e.g.: ('my', 'service').
+    :return: True if key parts start with sub_key_parts, otherwise False.
     """
-    assert isinstance(key, str) and len(str) > 0, "Key must be a string."
-    assert isinstance(sub_key, str), "Subkey must be a string."
-
-    if not sub_key.endswith("/"):
-        sub_key += '/'
-
-    return key.startswith(sub_key)
+    return tuple(key_parts[:len(sub_key_parts)]) == tuple(sub_key_parts)
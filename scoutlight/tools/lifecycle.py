@@ -1,46 +1,67 @@
+from enum import IntEnum
+
+
 class LifecycleException(Exception):
     pass
 
 
-class Lifecycle(object):
+class LifecycleState(IntEnum):
     # State indicating that the object was created (after call to __init__) but was not setup yet.
-    CREATED = "CREATED"
+    CREATED = 0
 
     # State indicating that a call to 'setup' was made and the instance is ready for use.
-    INITIALIZED = "INITIALIZED"
+    INITIALIZED = 1
 
     # State indicating that a call to 'destroy' was made. The instance cannot be reused.
-    DESTROYED = "DESTROYED"
+    DESTROYED = 2
+
+
+# Error message for each state 'setup' cannot be called from (formatted with the class name).
+_SETUP_ERRORS = {
+    LifecycleState.INITIALIZED: "{} is already initialized.",
+    LifecycleState.DESTROYED: "{} has been destroyed and cannot be re-initialized.",
+}
+
+# Error message for each state the object cannot be used in (formatted with the class name).
+_USE_ERRORS = {
+    LifecycleState.CREATED: "{} has not been initialized yet.",
+    LifecycleState.DESTROYED: "{} has been destroyed and cannot be used anymore.",
+}
+
+
+class Lifecycle(object):
+    __slots__ = ('__lifecycle_state',)
+
+    # Lifecycle states (see LifecycleState).
+    CREATED = LifecycleState.CREATED
+    INITIALIZED = LifecycleState.INITIALIZED
+    DESTROYED = LifecycleState.DESTROYED
 
     def __init__(self):
         # type: () -> None
         """
         Class initializer.
         """
-        self.__lifecycle_state = Lifecycle.CREATED
+        self.__lifecycle_state = LifecycleState.CREATED
 
     def setup(self):
         # type: () -> None
-        if self.__lifecycle_state == Lifecycle.CREATED:
-            # That's fine -- we're switching state to 'INITIALIZED'.
-            self.__lifecycle_state = Lifecycle.INITIALIZED
-        elif self.__lifecycle_state == Lifecycle.INITIALIZED:
-            raise LifecycleException("{} is already initialized.".format(self.__class__.__name__))
-        else:
-            # DESTROYED
-            raise LifecycleException(
-                "{} has been destroyed and cannot be re-initialized.".format(self.__class__.__name__))
+        # Switching state to 'INITIALIZED' is valid only from 'CREATED'.
+        if self.__lifecycle_state != LifecycleState.CREATED:
+            raise LifecycleException(_SETUP_ERRORS[self.__lifecycle_state].format(self.__class__.__name__))
+
+        self.__lifecycle_state = LifecycleState.INITIALIZED
 
     def destroy(self):
         # type: () -> None
         """
         Mark this lifecycle as destroyed.
         """
-        self.__lifecycle_state = Lifecycle.DESTROYED
+        self.__lifecycle_state = LifecycleState.DESTROYED
 
     @property
     def lifecycle_state(self):
-        # type: () -> str
+        # type: () -> LifecycleState
         """
         Returns the lifecycle state of this object.
         """
@@ -52,8 +73,5 @@ class Lifecycle(object):
         Test if this object is in initialized state or not. If it is not, an exception is raised to indicate
         the object cannot be used.
         """
-        if self.lifecycle_state == Lifecycle.CREATED:
-            raise LifecycleException("{} has not been initialized yet.".format(self.__class__.__name__))
-        elif self.lifecycle_state == Lifecycle.DESTROYED:
-            raise LifecycleException(
-                "{} has been destroyed and cannot be used anymore.".format(self.__class__.__name__))
+        if self.__lifecycle_state != LifecycleState.INITIALIZED:
+            raise LifecycleException(_USE_ERRORS[self.__lifecycle_state].format(self.__class__.__name__))
@@ -1,7 +1,7 @@
 import inspect
 from abc import ABCMeta, abstractmethod
 
-from typing import Any, List
+from typing import Any, List, Dict
 
 from scoutlight.exceptions import DiscoveryException
 
@@ -13,9 +13,7 @@ class ObjectEditorException(DiscoveryException):
     pass
 
 
-class ObjectEditor(object):
-    __metaclass__ = ABCMeta
-
+class ObjectEditor(metaclass=ABCMeta):
     """
     An object editor allows a caller to manipulate an object's state (data) via programmatic API, without knowing
     the exact details of the object.
@@ -34,7 +32,7 @@ class ObjectEditor(object):
         :param key: Attribute/property to be set.
         :param value: Value to assign.
         """
-        raise NotImplementedError()
+        ...
 
     @abstractmethod
     def get_value(self, obj, key):
@@ -46,15 +44,17 @@ class ObjectEditor(object):
         :param key: Attribute/property to retrieve.
         :raises AttributeError: If attribute/property does not exist.
         """
-        raise NotImplementedError()
+        ...
 
     @abstractmethod
     def supports(self, obj):
         # type: (Any) -> bool
         """
         Test if this editor supports a given object type.
+
+        Support must depend on the object's type only, as registries cache the editor found for each type.
         """
-        raise NotImplementedError()
+        ...
 
     @staticmethod
     def _assert_key(key):
@@ -62,7 +62,7 @@ class ObjectEditor(object):
         """
         Assert that a given key is a valid string.
         """
-        assert isinstance(key, basestring), "Key must be a string."
+        assert isinstance(key, str), "Key must be a string."
 
     def _assert_support(self, obj):
         # type: (Any) -> None
@@ -147,6 +147,9 @@ class ObjectEditorRegistry(object):
         # Maintains a list of object editors.
         self._registry = []  # type: List[ObjectEditor]
 
+        # Editor found for each object type, populated on first lookup.
+        self._type_cache = {}  # type: Dict[type, ObjectEditor]
+
     def add_editor(self, editor):
         # type: (ObjectEditor) -> None
         """
@@ -155,18 +158,31 @@ class ObjectEditorRegistry(object):
         :param editor: Editor to add.
         """
         self._registry.append(editor)
+        self._type_cache.clear()
 
     def find_editor_for(self, obj):
         # type: (Any) -> ObjectEditor
+        """
+        Find the first registered editor that supports a given object.
+
+        :param obj: Object to find an editor for.
+        :return: Object editor.
+        :raises ObjectEditorException: If no editor found for the given object.
+        """
+        obj_type = type(obj)
+        editor = self._type_cache.get(obj_type)  # type: ObjectEditor
+        if editor is not None:
+            return editor
 
         for editor in self._registry:
             if editor.supports(obj):
+                self._type_cache[obj_type] = editor
                 return editor
 
         raise ObjectEditorException("No editor found for object of type {}".format(type(obj)))
 
     def get_value(self, obj, key):
-        # type: (Any, str) -> None
+        # type: (Any, str) -> Any
         """
         Lookup an object editor that can handle the given object and apply 'get_value' to it.
 
@@ -176,7 +192,7 @@ class ObjectEditorRegistry(object):
         :raises AttributeError: If attribute/property does not exist.
         :raises ObjectEditorException: If no editor found for the given object.
         """
-        self.find_editor_for(obj).get_value(obj, key)
+        return self.find_editor_for(obj).get_value(obj, key)
 
     def set_value(self, obj, key, value):
         # type: (Any, str, Any) -> None
@@ -1,14 +1,450 @@
+import ctypes
+import ctypes.util
 import logging
-from threading import Thread, Event, current_thread
-from time import time
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from heapq import heappush, heappop, heapify
+from itertools import count
+from queue import SimpleQueue, Empty
+from threading import Thread, Event, Lock, Condition, current_thread, main_thread
+from time import monotonic_ns
 
-from typing import Callable, Union
+from typing import Callable, Union, Optional, Iterator, List, Tuple, Any
 
 logger = logging.getLogger(__name__)
 
 # Default maximum consecutive failure counts before the timer exists.
 DEFAULT_MAX_FAILURE_COUNT = 10
 
+# Time (in seconds) to wait for a stopped timer's callback to return, on top of two intervals, before giving up.
+STOP_TIMEOUT_GRACE_PERIOD = 1.0
+
+# Time (in seconds) an idle worker thread waits for another timer to run before it exits.
+IDLE_WORKER_TIMEOUT = 60.0
+
+# Backend running the timer on a thread of its own.
+THREAD_BACKEND = 'thread'
+
+# Backend running the timer on a scheduler thread, shared by all timers of this backend.
+SHARED_BACKEND = 'shared'
+
+# Backend running the timer on the main thread, from a SIGALRM handler (Unix only).
+SIGNAL_BACKEND = 'signal'
+
+# Clock that does not advance while the system is suspended.
+MONOTONIC_CLOCK = 'monotonic'
+
+# Clock that keeps advancing while the system is suspended (timerfd only), so ticks are not postponed by a suspend.
+BOOTTIME_CLOCK = 'boottime'
+
+# Overrun policy issuing the callback once for all the ticks that passed (e.g.: during a long callback).
+COALESCE_OVERRUN = 'coalesce'
+
+# Overrun policy issuing the callback once for every tick that passed.
+REPLAY_OVERRUN = 'replay'
+
+# Overrun policy skipping the callback when more than a single tick passed.
+DROP_OVERRUN = 'drop'
+
+# Identifiers of the clocks (see 'clock_gettime') the timerfd can be measured by. The timerfd is used on Linux only,
+# where both clocks are available.
+_TIMERFD_CLOCK_IDS = {
+    MONOTONIC_CLOCK: getattr(time, 'CLOCK_MONOTONIC', None),
+    BOOTTIME_CLOCK: getattr(time, 'CLOCK_BOOTTIME', None),
+}
+
+
+# Number of nanoseconds in a second.
+_NANOSECONDS_PER_SECOND = 1000000000
+
+
+class _Timespec(ctypes.Structure):
+    """
+    C 'struct timespec'.
+    """
+    _fields_ = [('tv_sec', ctypes.c_long), ('tv_nsec', ctypes.c_long)]
+
+
+class _Itimerspec(ctypes.Structure):
+    """
+    C 'struct itimerspec'.
+    """
+    _fields_ = [('it_interval', _Timespec), ('it_value', _Timespec)]
+
+
+def _load_timerfd_library():
+    # type: () -> Optional[ctypes.CDLL]
+    """
+    Load the C library for its timerfd functions, which are not exposed by the 'os' module.
+
+    :return: The C library, or None if the platform does not support timerfd and eventfd.
+    """
+    if not sys.platform.startswith('linux') or not hasattr(os, 'eventfd'):
+        return None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        libc.timerfd_create.argtypes = (ctypes.c_int, ctypes.c_int)
+        libc.timerfd_settime.argtypes = (
+            ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Itimerspec), ctypes.POINTER(_Itimerspec))
+    except (OSError, AttributeError):
+        return None
+
+    return libc
+
+
+# The C library used for timerfd, or None to wait on the stop event instead (e.g.: on non-Linux platforms).
+_TIMERFD_LIBRARY = _load_timerfd_library()
+
+
+def _timerfd_create(clock_id):
+    # type: (int) -> int
+    """
+    Create a non-blocking timerfd.
+
+    :param clock_id: The clock the timer is measured by (e.g.: time.CLOCK_MONOTONIC).
+    :return: The timer's file descriptor.
+    """
+    timer_fd = _TIMERFD_LIBRARY.timerfd_create(clock_id, os.O_CLOEXEC | os.O_NONBLOCK)  # type: int
+    if timer_fd < 0:
+        error = ctypes.get_errno()  # type: int
+        raise OSError(error, os.strerror(error))
+
+    return timer_fd
+
+
+def _timerfd_settime(timer_fd, interval_ns):
+    # type: (int, int) -> None
+    """
+    Arm a timerfd to expire periodically, starting one interval from now. The kernel keeps the following expirations
+    at a fixed phase.
+
+    :param timer_fd: The timer's file descriptor.
+    :param interval_ns: The interval between expirations, in nanoseconds.
+    """
+    interval = _Timespec(*divmod(interval_ns, _NANOSECONDS_PER_SECOND))  # type: _Timespec
+    spec = _Itimerspec(interval, interval)
+
+    if _TIMERFD_LIBRARY.timerfd_settime(timer_fd, 0, ctypes.byref(spec), None) < 0:
+        error = ctypes.get_errno()  # type: int
+        raise OSError(error, os.strerror(error))
+
+
+def _expirations(deadline_ns, interval_ns):
+    # type: (int, int) -> int
+    """
+    Count the deadlines of a periodic timer that have passed, starting at a given (passed) deadline.
+
+    :param deadline_ns: The first passed deadline, in nanoseconds.
+    :param interval_ns: The interval between deadlines, in nanoseconds.
+    :return: The number of passed deadlines (at least 1).
+    """
+    return (monotonic_ns() - deadline_ns) // interval_ns + 1
+
+
+class _WorkerPool:
+    """
+    A pool of daemon worker threads that run the loops of thread backend timers.
+
+    A timer occupies a worker for as long as it runs, so the pool is not bounded: a new worker is created when none is
+    idle. A worker whose timer exited waits for another timer to run (up to IDLE_WORKER_TIMEOUT) before exiting, so
+    starting timers usually reuses a thread rather than creating one.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """
+        Class initializer.
+        """
+        self._lock = Lock()
+
+        # Task queues of the idle workers (the most recently idle worker last).
+        self._idle_workers = []  # type: List[SimpleQueue]
+        self._worker_ids = count(1)
+
+    def run(self, name, function):
+        # type: (str, Callable[[], None]) -> None
+        """
+        Run a function on an idle worker (or on a new one, if none is idle).
+
+        :param name: Name for the worker thread while it runs the function.
+        :param function: The function to run.
+        """
+        with self._lock:
+            if self._idle_workers:
+                self._idle_workers.pop().put((name, function))
+                return
+
+        Thread(target=self._work, args=(name, function), name='PeriodicTimerWorker-{}'.format(next(self._worker_ids)),
+               daemon=True).start()
+
+    def _work(self, name, function):
+        # type: (str, Callable[[], None]) -> None
+        """
+        A thread function that runs a given function, and then the functions handed to it while idle.
+        """
+        tasks = SimpleQueue()  # type: SimpleQueue
+        worker = current_thread()
+        worker_name = worker.name  # type: str
+
+        while True:
+            worker.name = name
+            try:
+                function()
+            finally:
+                worker.name = worker_name
+
+            with self._lock:
+                self._idle_workers.append(tasks)
+
+            try:
+                name, function = tasks.get(timeout=IDLE_WORKER_TIMEOUT)
+            except Empty:
+                with self._lock:
+                    if any(idle_tasks is tasks for idle_tasks in self._idle_workers):
+                        self._idle_workers.remove(tasks)
+                        return
+
+                # A function was handed to this worker just as it timed out.
+                name, function = tasks.get()
+
+
+class _SharedScheduler:
+    """
+    A scheduler thread that issues the callbacks of all shared periodic timers, by the order of their deadlines.
+
+    The thread is started when a timer is added, and exits once no timers are left.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """
+        Class initializer.
+        """
+        self._condition = Condition()
+
+        # Heap of the scheduled timers: (deadline in nanoseconds, sequence number to break ties, timer).
+        self._deadlines = []  # type: List[Tuple[int, int, PeriodicTimer]]
+        self._sequence = count()
+
+        self._thread = None  # type: Optional[Thread]
+
+        # The timer whose callback is currently issued, if any.
+        self._current = None  # type: Optional[PeriodicTimer]
+
+    def add(self, timer):
+        # type: (PeriodicTimer) -> None
+        """
+        Schedule a timer, with its first deadline one interval from now.
+
+        :param timer: The timer to schedule.
+        """
+        with self._condition:
+            heappush(self._deadlines, (monotonic_ns() + timer._interval_ns, next(self._sequence), timer))
+
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name='PeriodicTimerScheduler', daemon=True)
+                self._thread.start()
+            else:
+                self._condition.notify()
+
+    def remove(self, timer):
+        # type: (PeriodicTimer) -> None
+        """
+        Remove a timer from the schedule, and wait (up to the timer's stop timeout) for its callback to return if it is
+        currently issued, unless called by the callback itself.
+
+        :param timer: The timer to remove.
+        """
+        with self._condition:
+            self._deadlines = [entry for entry in self._deadlines if entry[2] is not timer]
+            heapify(self._deadlines)
+            self._condition.notify()
+
+            if current_thread() is not self._thread:
+                if not self._condition.wait_for(lambda: self._current is not timer, timer._stop_timeout()):
+                    logger.warning("Periodic timer callback did not return within the stop timeout (%s).",
+                                   self._thread.name)
+
+    def is_scheduled(self, timer):
+        # type: (PeriodicTimer) -> bool
+        """
+        :param timer: A timer.
+        :return: True if the timer is scheduled (or its callback is currently issued), False otherwise.
+        """
+        with self._condition:
+            return self._current is timer or any(entry[2] is timer for entry in self._deadlines)
+
+    def _run(self):
+        # type: () -> None
+        """
+        A thread function that issues the callbacks of the scheduled timers as their deadlines pass.
+        """
+        with self._condition:
+            while self._deadlines:
+                deadline_ns, _, timer = self._deadlines[0]
+                timeout_ns = deadline_ns - monotonic_ns()  # type: int
+                if timeout_ns > 0:
+                    self._condition.wait(timeout_ns / _NANOSECONDS_PER_SECOND)
+                    continue
+
+                heappop(self._deadlines)
+                self._current = timer
+                expirations = _expirations(deadline_ns, timer._interval_ns)  # type: int
+
+                # The callback is issued without the lock, so timers can be added or removed meanwhile.
+                self._condition.release()
+                try:
+                    keep_running = timer._expire(expirations)  # type: bool
+                finally:
+                    self._condition.acquire()
+                    self._current = None
+                    self._condition.notify_all()
+
+                if keep_running and not timer._stop_event.is_set():
+                    deadline_ns += timer._interval_ns * expirations
+                    heappush(self._deadlines, (deadline_ns, next(self._sequence), timer))
+
+            self._thread = None
+
+
+class _SignalScheduler:
+    """
+    A scheduler that issues the callbacks of all signal periodic timers from a SIGALRM handler, by the order of their
+    deadlines. Callbacks run on the main thread (between its Python instructions), so no thread is involved at all.
+
+    The real-time interval timer (ITIMER_REAL) is armed to the earliest deadline. The scheduler replaces the SIGALRM
+    handler as long as timers are scheduled, and restores the previous handler once no timers are left.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """
+        Class initializer.
+        """
+        # Heap of the scheduled timers: (deadline in nanoseconds, sequence number to break ties, timer).
+        self._deadlines = []  # type: List[Tuple[int, int, PeriodicTimer]]
+        self._sequence = count()
+
+        # The SIGALRM handler that was replaced by the scheduler's handler, if replaced.
+        self._previous_handler = None  # type: Any
+        self._handler_installed = False  # type: bool
+
+        # The timer whose callback is currently issued, if any.
+        self._current = None  # type: Optional[PeriodicTimer]
+
+        # Depth of schedule updates in progress (including re-arming the interval timer). The signal handler does not
+        # issue callbacks meanwhile; it records the alarm instead, and the alarm is handled once the interval timer is
+        # re-armed.
+        self._busy = 0  # type: int
+        self._missed_alarm = False  # type: bool
+
+    def add(self, timer):
+        # type: (PeriodicTimer) -> None
+        """
+        Schedule a timer, with its first deadline one interval from now.
+
+        :param timer: The timer to schedule.
+        """
+        assert current_thread() is main_thread(), "Signal periodic timers can be started on the main thread only."
+
+        self._busy += 1
+        try:
+            heappush(self._deadlines, (monotonic_ns() + timer._interval_ns, next(self._sequence), timer))
+        finally:
+            self._busy -= 1
+
+        self._rearm()
+
+    def remove(self, timer):
+        # type: (PeriodicTimer) -> None
+        """
+        Remove a timer from the schedule.
+
+        :param timer: The timer to remove.
+        """
+        assert current_thread() is main_thread(), "Signal periodic timers can be stopped on the main thread only."
+
+        self._busy += 1
+        try:
+            self._deadlines = [entry for entry in self._deadlines if entry[2] is not timer]
+            heapify(self._deadlines)
+        finally:
+            self._busy -= 1
+
+        self._rearm()
+
+    def is_scheduled(self, timer):
+        # type: (PeriodicTimer) -> bool
+        """
+        :param timer: A timer.
+        :return: True if the timer is scheduled (or its callback is currently issued), False otherwise.
+        """
+        return self._current is timer or any(entry[2] is timer for entry in self._deadlines)
+
+    def _rearm(self):
+        # type: () -> None
+        """
+        Arm the interval timer to the earliest deadline, or disarm it (and restore the previous SIGALRM handler) if no
+        timers are left.
+        """
+        # An alarm must not change the schedule (or restore the previous handler) while the timer is re-armed.
+        self._busy += 1
+        try:
+            if self._deadlines:
+                if not self._handler_installed:
+                    self._previous_handler = signal.signal(signal.SIGALRM, self._on_alarm)
+                    self._handler_installed = True
+
+                # A zero value disarms the interval timer, so passed deadlines are armed to expire right away.
+                timeout_ns = max(self._deadlines[0][0] - monotonic_ns(), 1000)  # type: int
+                signal.setitimer(signal.ITIMER_REAL, timeout_ns / _NANOSECONDS_PER_SECOND)
+            elif self._handler_installed:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.signal(signal.SIGALRM,
+                              self._previous_handler if self._previous_handler is not None else signal.SIG_DFL)
+                self._previous_handler = None
+                self._handler_installed = False
+        finally:
+            self._busy -= 1
+
+        if self._missed_alarm:
+            self._missed_alarm = False
+            self._on_alarm(signal.SIGALRM, None)
+
+    def _on_alarm(self, signum, frame):
+        # type: (int, Any) -> None
+        """
+        A SIGALRM handler that issues the callbacks of the timers whose deadlines passed.
+        """
+        if self._busy:
+            self._missed_alarm = True
+            return
+
+        self._busy += 1
+        try:
+            while self._deadlines and self._deadlines[0][0] <= monotonic_ns():
+                deadline_ns, _, timer = heappop(self._deadlines)
+                expirations = _expirations(deadline_ns, timer._interval_ns)  # type: int
+
+                self._current = timer
+                try:
+                    keep_running = timer._expire(expirations)  # type: bool
+                finally:
+                    self._current = None
+
+                if keep_running and not timer._stop_event.is_set():
+                    deadline_ns += timer._interval_ns * expirations
+                    heappush(self._deadlines, (deadline_ns, next(self._sequence), timer))
+        finally:
+            self._busy -= 1
+
+        self._rearm()
+
 
 class PeriodicTimer:
     """
@@ -16,60 +452,127 @@ class PeriodicTimer:
 
     The periodic timer supports the notion of "failure counts exit", which will cause the timer to exit when after
     a certain number of consecutive failures occurred.
+
+    Ticks keep a fixed phase, so periods do not drift by the time spent in the callback. When ticks pass during a long
+    callback, the overrun policy decides whether to issue the callback once for all of them (default), once for each
+    of them, or not at all. With the thread backend, each timer runs on a thread of its own (a pooled worker thread,
+    for as long as the timer runs): on Linux, it waits on a timerfd; on other platforms, it waits on the stop event.
+    With the shared backend, all timers run on a single scheduler thread, so a slow callback delays the callbacks of
+    other shared timers. With the signal backend, all timers run on the main thread, from a SIGALRM handler: callbacks
+    must be short, and the process must not use SIGALRM or the real-time interval timer otherwise.
     """
 
-    def __init__(self, interval, callback, name=None):
-        # type: (Union[int, float], Callable, str) -> None
+    def __init__(self, interval, callback, name=None, backend=THREAD_BACKEND, clock=MONOTONIC_CLOCK,
+                 on_overrun=COALESCE_OVERRUN):
+        # type: (Union[int, float], Callable, str, str, str, str) -> None
         """
         Class initializer.
 
         :param interval: The interval in seconds.
         :param callback: A callback function to call periodically.
-        :param name: Optional name for the periodic timer thread.
+        :param name: Optional name for the periodic timer thread (thread backend only).
+        :param backend: THREAD_BACKEND to run the timer on a thread of its own, SHARED_BACKEND to run it on the
+                        shared scheduler thread, or SIGNAL_BACKEND to run it on the main thread (the timer must be
+                        started and stopped on the main thread).
+        :param clock: MONOTONIC_CLOCK, or BOOTTIME_CLOCK to count the time the system is suspended as well. The clock
+                      applies to the timerfd only (thread backend, on Linux); otherwise, the monotonic clock is used.
+        :param on_overrun: Policy for ticks that passed while the callback was issued: COALESCE_OVERRUN to issue the
+                           callback once, REPLAY_OVERRUN to issue it once for every tick, or DROP_OVERRUN to skip it.
         """
         assert isinstance(interval, (int, float)), "interval must be numeric value."
         assert interval > 0, "interval must be positive."
         assert callable(callback), "invalid callback parameter."
+        assert backend in (THREAD_BACKEND, SHARED_BACKEND, SIGNAL_BACKEND), "invalid backend parameter."
+        assert backend != SIGNAL_BACKEND or hasattr(signal, 'setitimer'), "signal backend is not supported."
+        assert clock in _TIMERFD_CLOCK_IDS, "invalid clock parameter."
+        assert on_overrun in (COALESCE_OVERRUN, REPLAY_OVERRUN, DROP_OVERRUN), "invalid on_overrun parameter."
 
         self._interval = interval  # type: int
+        self._interval_ns = int(interval * _NANOSECONDS_PER_SECOND)  # type: int
         self.callback = callback  # type: Callable
+        self._clock = clock  # type: str
+        self._on_overrun = on_overrun  # type: str
+
+        # Name of the timer's thread while it runs (thread backend only).
+        self._name = name if name is not None else 'PeriodicTimer-{}'.format(next(_TIMER_IDS))  # type: str
+
+        # The scheduler that runs the timer, or None to run it on a worker thread (thread backend).
+        self._scheduler = None  # type: Optional[Union[_SharedScheduler, _SignalScheduler]]
+        if backend == SHARED_BACKEND:
+            self._scheduler = _SHARED_SCHEDULER
+        elif backend == SIGNAL_BACKEND:
+            self._scheduler = _SIGNAL_SCHEDULER
+
+        # Set once the timer's loop exits on its worker thread (thread backend only); None until started.
+        self._exit_event = None  # type: Optional[Event]
+
+        # The worker thread the timer's loop runs on (thread backend only); None until the loop starts.
+        self._worker = None  # type: Optional[Thread]
 
-        self._thread = Thread(target=self._run, name=name)
-        self._thread.setDaemon(True)
         self._stop_event = Event()
 
+        # An eventfd that wakes the timer thread when stopped (timerfd only). Closed by the timer thread upon exit.
+        self._stop_fd = None  # type: Optional[int]
+        self._stop_fd_lock = Lock()
+
         # Measures the number of consecutive failures.
         self._failure_count = 0  # type: int
         self._max_failure_count = DEFAULT_MAX_FAILURE_COUNT
 
-        # Flag indicating if the periodic thread currently running or not.
-        self._running = False  # type: bool
+        # Time of the last successful callback (or of the timer's start), in nanoseconds.
+        self._last_success_ns = 0  # type: int
 
     def start(self):
         # type: () -> None
         """
         Starts the periodic timer.
         """
-        assert not self._running, "Periodic timer already running."
+        assert not self.is_running(), "Periodic timer already running."
         assert not self._stop_event.is_set(), "Periodic timer terminated; cannot restart."
 
-        self._thread.start()
+        self._last_success_ns = monotonic_ns()
+
+        if self._scheduler is not None:
+            self._scheduler.add(self)
+            return
+
+        if _TIMERFD_LIBRARY is not None:
+            self._stop_fd = os.eventfd(0, os.EFD_CLOEXEC | os.EFD_NONBLOCK)
+
+        self._exit_event = Event()
+        _WORKER_POOL.run(self._name, self._run)
 
     def stop(self):
         # type: () -> None
         """
-        Stops the periodic timer and wait for the thread to exit.
+        Stops the periodic timer and wait for the thread to exit (or, with the shared backend, for a callback that is
+        currently issued to return). The wait is bounded by two intervals and a grace period; if the callback does not
+        return by then (e.g.: blocked on I/O), a warning is logged and the timer is left to exit on its own.
         """
-        if self._thread.is_alive():
+        if self._scheduler is not None:
+            if self.is_running():
+                self._stop_event.set()
+                self._scheduler.remove(self)
+        elif self._exit_event is not None and not self._exit_event.is_set():
             self._stop_event.set()
-            self._thread.join()
+
+            with self._stop_fd_lock:
+                if self._stop_fd is not None:
+                    os.eventfd_write(self._stop_fd, 1)
+
+            # When stopped from its own callback, the timer exits once the callback returns; do not wait for it.
+            if current_thread() is not self._worker and not self._exit_event.wait(self._stop_timeout()):
+                logger.warning("Periodic timer thread did not exit within the stop timeout (%s).", self._name)
 
     def is_running(self):
         # type: () -> bool
         """
-        :return: True if thread is running, False otherwise.
+        :return: True if thread is running (and was not asked to stop), False otherwise.
         """
-        return self._running
+        if self._scheduler is not None:
+            return not self._stop_event.is_set() and self._scheduler.is_scheduled(self)
+
+        return self._exit_event is not None and not self._exit_event.is_set() and not self._stop_event.is_set()
 
     def set_max_failure_count(self, max_failure_count):
         # type: (int) -> None
@@ -92,37 +595,159 @@ class PeriodicTimer:
         """
         return self._failure_count
 
+    def _stop_timeout(self):
+        # type: () -> float
+        """
+        :return: Time (in seconds) to wait for the timer's callback to return when stopped.
+        """
+        return 2 * self._interval + STOP_TIMEOUT_GRACE_PERIOD
+
     def _run(self):
         """
         A thread function that runs in loop periodically issues the callback.
         """
+        self._worker = current_thread()
+        try:
+            ticks = (self._timerfd_ticks() if _TIMERFD_LIBRARY is not None
+                     else self._event_ticks())  # type: Iterator[int]
 
-        self._running = True
-        thread_name = current_thread().name
+            # Run as long as our event has not been set.
+            for expirations in ticks:
+                if not self._expire(expirations):
+                    break
 
-        start_time = time()  # type: float
+            ticks.close()
 
-        # Run as long as our event has not been set.
-        while not self._stop_event.wait(self._interval):
-            # noinspection PyBroadException
-            try:
-                self.callback()
-                self._failure_count = 0
-                start_time = time()
-            except Exception:
-                # Upon failure -- log the error.
-                logger.exception("Error during periodic timer callback.")
-
-                # If timer supports termination after consecutive failures - terminate thread.
-                self._failure_count += 1
-                if 0 < self._max_failure_count <= self._failure_count:
-                    elapsed_time = time() - start_time  # type: float
-
-                    logger.error(
-                        "Maximum number of failures reached (count: {}) in {:.2f} seconds. "
-                        "Terminating periodic timer thread ({})."
-                        .format(thread_name, elapsed_time, self._failure_count))
-                    self._stop_event.set()
-
-        logger.info("Periodic timer thread terminated ({}).".format(thread_name))
-        self._running = False
+            logger.info("Periodic timer thread terminated (%s).", current_thread().name)
+        finally:
+            self._exit_event.set()
+
+    def _expire(self, expirations):
+        # type: (int) -> bool
+        """
+        Issue the callback for the ticks that passed, by the timer's overrun policy.
+
+        :param expirations: The number of ticks that passed since the callback was last issued.
+        :return: True to keep the timer running, False if it was stopped.
+        """
+        if expirations == 1 or self._on_overrun == COALESCE_OVERRUN:
+            return self._tick()
+
+        if self._on_overrun == DROP_OVERRUN:
+            return True
+
+        for _ in range(expirations):
+            if not self._tick() or self._stop_event.is_set():
+                return False
+
+        return True
+
+    def _tick(self):
+        # type: () -> bool
+        """
+        Issue the callback, counting consecutive failures.
+
+        :return: True to keep the timer running, False if it reached the maximum number of consecutive failures (and
+                 was stopped).
+        """
+        # noinspection PyBroadException
+        try:
+            self.callback()
+            self._failure_count = 0
+            self._last_success_ns = monotonic_ns()
+        except Exception:
+            # Upon failure -- log the error.
+            logger.exception("Error during periodic timer callback.")
+
+            # If timer supports termination after consecutive failures - terminate thread.
+            self._failure_count += 1
+            if 0 < self._max_failure_count <= self._failure_count:
+                elapsed_time = (monotonic_ns() - self._last_success_ns) / _NANOSECONDS_PER_SECOND  # type: float
+
+                logger.error(
+                    "Maximum number of failures reached (count: %d) in %.2f seconds. "
+                    "Terminating periodic timer thread (%s).",
+                    self._failure_count, elapsed_time, current_thread().name)
+                self._stop_event.set()
+                return False
+
+        return True
+
+    def _event_ticks(self):
+        # type: () -> Iterator[int]
+        """
+        Wait for the timer's ticks on the stop event, with deadlines at a fixed phase.
+
+        :return: An iterator that yields the number of ticks that passed upon every wake-up, until the timer is
+                 stopped.
+        """
+        deadline_ns = monotonic_ns() + self._interval_ns  # type: int
+
+        while not self._stop_event.wait(max(deadline_ns - monotonic_ns(), 0) / _NANOSECONDS_PER_SECOND):
+            expirations = _expirations(deadline_ns, self._interval_ns)  # type: int
+
+            # Woken up (slightly) before the deadline; wait for the rest of it.
+            if expirations < 1:
+                continue
+
+            deadline_ns += self._interval_ns * expirations
+            yield expirations
+
+    def _timerfd_ticks(self):
+        # type: () -> Iterator[int]
+        """
+        Wait for the timer's ticks on a timerfd, armed to expire at a fixed phase. Stopping the timer wakes the wait
+        through the stop eventfd.
+
+        :return: An iterator that yields the number of ticks that passed upon every wake-up, until the timer is
+                 stopped.
+        """
+        try:
+            timer_fd = _timerfd_create(_TIMERFD_CLOCK_IDS[self._clock])  # type: int
+        except OSError:
+            self.__close_stop_fd()
+            raise
+
+        poller = select.epoll()
+        try:
+            poller.register(timer_fd, select.EPOLLIN)
+            poller.register(self._stop_fd, select.EPOLLIN)
+
+            _timerfd_settime(timer_fd, self._interval_ns)
+
+            while True:
+                poller.poll()
+                if self._stop_event.is_set():
+                    return
+
+                # Read (and reset) the expiration count, so the timer is not ready until it expires again. The read is
+                # required on every tick, even with an edge-triggered registration: the kernel only forwards a periodic
+                # timerfd to its next expiration when it is read, so an unread timer expires once and stays idle.
+                expirations, = struct.unpack('@Q', os.read(timer_fd, 8))
+                yield expirations
+        finally:
+            poller.close()
+            os.close(timer_fd)
+            self.__close_stop_fd()
+
+    def __close_stop_fd(self):
+        # type: () -> None
+        """
+        Close the stop eventfd, once the timer thread no longer waits on it.
+        """
+        with self._stop_fd_lock:
+            os.close(self._stop_fd)
+            self._stop_fd = None
+
+
+# Sequence numbers for the default names of timers.
+_TIMER_IDS = count(1)
+
+# The worker threads of the timers that run on the thread backend.
+_WORKER_POOL = _WorkerPool()
+
+# The scheduler of the timers that run on the shared backend.
+_SHARED_SCHEDULER = _SharedScheduler()
+
+# The scheduler of the timers that run on the signal backend.
+_SIGNAL_SCHEDULER = _SignalScheduler()
@@ -0,0 +1,117 @@
+import unittest
+
+from scoutlight.discovery.service_discovery import RoundRobingServiceLocator, ServiceUnavailableException, \
+    ServiceDiscovery
+from scoutlight.key_factory import Keys
+from scoutlight.registry.in_memory_registry import InMemoryRegistry
+
+CLUSTER_ID = "cluster"
+SERVICE_NAME = "service"
+
+
+class TestRoundRobingServiceLocator(unittest.TestCase):
+    """
+    Test cases for RoundRobingServiceLocator.
+    """
+
+    def setUp(self):
+        """
+        Test fixture -- create an empty registry and a locator on top of it.
+        """
+        self.registry = InMemoryRegistry()
+        self.locator = RoundRobingServiceLocator(self.registry, CLUSTER_ID, SERVICE_NAME)
+        self.members_key = Keys.create_service_members_base_key(CLUSTER_ID, SERVICE_NAME)
+
+    def tearDown(self):
+        """
+        Test fixture -- release the locator's registry watch.
+        """
+        self.locator.close()
+
+    def register(self, instance_id):
+        """
+        Register a service instance directly in the registry.
+        """
+        self.registry.put(Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, instance_id), "")
+
+    def test_should_raise_exception_when_no_instance_available(self):
+        """
+        Test that looking up a service without any registered instance raises an exception.
+        """
+        self.assertRaises(ServiceUnavailableException, self.locator.find_service)
+
+    def test_should_rotate_between_instances(self):
+        """
+        Test that each instance is returned once before any instance is returned again.
+        """
+        self.register("a")
+        self.register("b")
+        self.register("c")
+
+        first_round = [self.locator.find_service() for _ in range(3)]
+        second_round = [self.locator.find_service() for _ in range(3)]
+
+        self.assertEqual(len(set(first_round)), 3)
+        self.assertListEqual(first_round, second_round)
+
+    def test_should_detect_new_instance(self):
+        """
+        Test that a newly registered instance is picked up even though the members list is cached.
+        """
+        self.register("a")
+        self.locator.find_service()
+
+        self.register("b")
+
+        self.assertEqual(self.locator.find_service(),
+                         Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, "b"))
+
+
+class TestServiceDiscovery(unittest.TestCase):
+    """
+    Test cases for ServiceDiscovery.
+    """
+
+    def test_should_reuse_service_locator(self):
+        """
+        Test that service locators are shared per cluster and service.
+        """
+        discovery = ServiceDiscovery(InMemoryRegistry())
+
+        locator = discovery.create_service_locator(CLUSTER_ID, SERVICE_NAME)
+
+        self.assertIs(discovery.create_service_locator(CLUSTER_ID, SERVICE_NAME), locator)
+        self.assertIsNot(discovery.create_service_locator(CLUSTER_ID, "other_service"), locator)
+
+    def test_should_keep_shared_locator_open_until_discovery_is_closed(self):
+        """
+        Test that closing a shared locator keeps it watching for changes, and closing the discovery releases it.
+        """
+        registry = InMemoryRegistry()
+        discovery = ServiceDiscovery(registry)
+        locator = discovery.create_service_locator(CLUSTER_ID, SERVICE_NAME)
+
+        registry.put(Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, "a"), "")
+        locator.find_service()
+
+        # Closing the shared locator is a no-op: a newly registered instance is still picked up.
+        locator.close()
+        registry.put(Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, "b"), "")
+        self.assertEqual(locator.find_service(), Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, "b"))
+
+        discovery.close()
+        self.assertDictEqual(registry._watches, {})
+        self.assertIsNot(discovery.create_service_locator(CLUSTER_ID, SERVICE_NAME), locator)
+
+    def test_should_list_service_instances(self):
+        """
+        Test that service instances are listed with their properties.
+        """
+        registry = InMemoryRegistry()
+        registry.put(Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, "a"), '{"port": "8001"}')
+        registry.put(Keys.create_service_instance_key(CLUSTER_ID, SERVICE_NAME, "b"), '{"port": "8080"}')
+
+        instances = ServiceDiscovery(registry).list_service_instances(CLUSTER_ID, SERVICE_NAME)
+
+        self.assertDictEqual({instance.instance_id: instance.properties for instance in instances},
+                             {"a": {"port": "8001"}, "b": {"port": "8080"}})
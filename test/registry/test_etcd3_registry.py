@@ -1,5 +1,5 @@
+import threading
 import unittest
-from collections import OrderedDict
 
 import etcd3
 from typing import List, Dict
@@ -20,14 +20,19 @@ class TestEtcd3Registry(unittest.TestCase):
     The test requires an active etcd3 member on localhost.
     """
 
-    def __init__(self, *args, **kwargs):
-        super(TestEtcd3Registry, self).__init__(*args, **kwargs)
-
-        # Create a new etcd3 client for accessing etcd3 cluster directly.
-        self.client = etcd3.client(host=ETCD_LOCALHOST.host, port=ETCD_LOCALHOST.port)
+    @classmethod
+    def setUpClass(cls):
+        """
+        Class fixture -- create a single etcd3 client for accessing etcd3 cluster directly, shared by all tests.
+        """
+        cls.client = etcd3.client(host=ETCD_LOCALHOST.host, port=ETCD_LOCALHOST.port)
 
-        # Create a new registry to run tests on.
-        self.registry = Etcd3Registry(ETCD_LOCALHOST)
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Class fixture -- close the shared etcd3 client.
+        """
+        cls.client.close()
 
     def setUp(self):
         """
@@ -35,6 +40,10 @@ class TestEtcd3Registry(unittest.TestCase):
         """
 
         self.client.delete_prefix("/")
+
+        # Create a new registry to run tests on. A destroyed registry cannot be set up again, so each test gets its own
+        # registry; registries share their gRPC channels through the client pool.
+        self.registry = Etcd3Registry(ETCD_LOCALHOST)
         self.registry.setup()
 
     def tearDown(self):
@@ -56,6 +65,16 @@ class TestEtcd3Registry(unittest.TestCase):
 
         self.assertEqual(result, SAMPLE_VALUE)
 
+    def test_should_get_value_put_after_cached_read(self):
+        """
+        Test that a value read (and cached) is replaced by a value subsequently put through the registry.
+        """
+        self.registry.put(SAMPLE_KEY, "first")
+        self.assertEqual(self.registry.get(SAMPLE_KEY), "first")
+
+        self.registry.put(SAMPLE_KEY, "second")
+        self.assertEqual(self.registry.get(SAMPLE_KEY), "second")
+
     def test_should_catch_exception_when_key_does_not_exist(self):
         """
         Test that querying for a non-existing key raises an exception.
@@ -107,12 +126,63 @@ class TestEtcd3Registry(unittest.TestCase):
 
         result = self.registry.fetch("/parent", True, True)  # type: Dict[str, str]
 
-        # We expect to get and ordered dictionary with 4 key/value pairs.
-        expected_results = OrderedDict([
-            ("/parent/child1", "1"),
-            ("/parent/child2", "2"),
-            ("/parent/child3", "3"),
-            ("/parent/child3/A", "3A")
-        ])
+        # We expect to get a dictionary with 4 key/value pairs, in order of creation.
+        expected_results = {
+            "/parent/child1": "1",
+            "/parent/child2": "2",
+            "/parent/child3": "3",
+            "/parent/child3/A": "3A",
+        }
 
         self.assertDictEqual(expected_results, result)
+        self.assertListEqual(list(result.items()), list(expected_results.items()))
+
+    def test_should_put_all_key_value_pairs_asynchronously(self):
+        """
+        Test that putting more key/value pairs than fit in a single transaction sets all of them.
+        """
+        values = {"/parent/child{}".format(index): str(index) for index in range(Etcd3Registry.MAX_TXN_OPS * 2 + 1)}
+
+        for future in self.registry.put_all_async(values):
+            future.result()
+
+        self.assertDictEqual(values, self.registry.fetch("/parent"))
+
+    def test_should_fetch_immediate_children_by_key(self):
+        """
+        Test that a registry fetching immediate children by key returns only the immediate children and their values.
+        """
+        registry = Etcd3Registry(ETCD_LOCALHOST, fetch_children_by_key=True)
+        registry.setup()
+        try:
+            registry.put("/parent/child1", "1")
+            registry.put("/parent/child2", "2")
+            registry.put("/parent/child2/A", "2A")
+
+            result = registry.fetch("/parent", keep_order=True)  # type: Dict[str, str]
+        finally:
+            registry.destroy()
+
+        self.assertDictEqual({"/parent/child1": "1", "/parent/child2": "2"}, result)
+
+    def test_should_get_existing_value_instead_of_putting(self):
+        """
+        Test that a conditional put-or-get returns the existing value if the key already exists.
+        """
+        self.assertTupleEqual(self.registry.put_if_not_exist_or_get(SAMPLE_KEY, SAMPLE_VALUE), (True, SAMPLE_VALUE))
+        self.assertTupleEqual(self.registry.put_if_not_exist_or_get(SAMPLE_KEY, "other"), (False, SAMPLE_VALUE))
+
+    def test_should_stop_notifying_cancelled_watch(self):
+        """
+        Test that a watch is notified of changes to its children until it is cancelled.
+        """
+        changed = threading.Event()
+        cancel = self.registry.watch_prefix("/parent", changed.set)
+
+        self.registry.put("/parent/child1", "1")
+        self.assertTrue(changed.wait(5))
+
+        cancel()
+        changed.clear()
+        self.registry.put("/parent/child2", "2")
+        self.assertFalse(changed.wait(1))
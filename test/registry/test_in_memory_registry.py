@@ -1,9 +1,8 @@
 import unittest
-from collections import OrderedDict
 
 from typing import List, Dict
 
-from scoutlight.registry import KeyDoesNotExist, Key
+from scoutlight.registry import KeyDoesNotExist, Key, Registry
 from scoutlight.registry.in_memory_registry import InMemoryRegistry
 
 SAMPLE_KEY = Key.create("/sampleKey")
@@ -89,12 +88,99 @@ class TestInMemoryRegistry(unittest.TestCase):
 
         result = self.registry.fetch("/parent", True, True)  # type: Dict[str, str]
 
-        # We expect to get and ordered dictionary with 4 key/value pairs.
-        expected_results = OrderedDict([
-            ("/parent/child1", "1"),
-            ("/parent/child2", "2"),
-            ("/parent/child3", "3"),
-            ("/parent/child3/A", "3A")
-        ])
+        # We expect to get a dictionary with 4 key/value pairs, in order of creation.
+        expected_results = {
+            "/parent/child1": "1",
+            "/parent/child2": "2",
+            "/parent/child3": "3",
+            "/parent/child3/A": "3A",
+        }
 
         self.assertDictEqual(expected_results, result)
+        self.assertListEqual(list(result.items()), list(expected_results.items()))
+
+    def test_should_put_all_key_value_pairs(self):
+        """
+        Test that putting a list of key/value pairs sets each of the pairs.
+        """
+        self.registry.put_all([("/parent/child1", "1"), ("/parent/child2", "2")])
+
+        self.assertEqual(self.registry.get("/parent/child1"), "1")
+        self.assertEqual(self.registry.get("/parent/child2"), "2")
+
+    def test_should_list_keys_in_order_of_creation(self):
+        """
+        Test that keys are listed in order of creation when requested to keep order.
+        """
+        self.registry.put("/parent/b", "")
+        self.registry.put("/parent/c", "")
+        self.registry.put("/parent/a", "")
+
+        result = self.registry.list_keys("/parent", keep_order=True)  # type: List[str]
+
+        self.assertListEqual(result, ["/parent/b", "/parent/c", "/parent/a"])
+
+    def test_should_put_only_if_key_does_not_exist(self):
+        """
+        Test that a conditional put sets a key only if it does not exist yet.
+        """
+        self.assertTrue(self.registry.put_if_not_exist(SAMPLE_KEY, SAMPLE_VALUE))
+        self.assertFalse(self.registry.put_if_not_exist(SAMPLE_KEY, "other"))
+
+        self.assertEqual(self.registry.get(SAMPLE_KEY), SAMPLE_VALUE)
+
+    def test_should_get_existing_value_instead_of_putting(self):
+        """
+        Test that a conditional put-or-get returns the existing value if the key already exists.
+        """
+        self.assertTupleEqual(self.registry.put_if_not_exist_or_get(SAMPLE_KEY, SAMPLE_VALUE), (True, SAMPLE_VALUE))
+        self.assertTupleEqual(self.registry.put_if_not_exist_or_get(SAMPLE_KEY, "other"), (False, SAMPLE_VALUE))
+
+    def test_should_limit_listed_keys(self):
+        """
+        Test that listing keys with a limit returns only the first keys, in the requested order.
+        """
+        self.registry.put("/parent/b", "")
+        self.registry.put("/parent/b/A", "")
+        self.registry.put("/parent/c", "")
+        self.registry.put("/parent/a", "")
+
+        self.assertListEqual(self.registry.list_keys("/parent", limit=2), ["/parent/a", "/parent/b"])
+        self.assertListEqual(self.registry.list_keys("/parent", keep_order=True, limit=2), ["/parent/b", "/parent/c"])
+        self.assertDictEqual(self.registry.fetch("/parent", True, limit=2), {"/parent/a": "", "/parent/b": ""})
+
+    def test_should_not_instantiate_registry_without_abstract_methods(self):
+        """
+        Test that a registry implementation missing abstract methods cannot be instantiated.
+        """
+        class IncompleteRegistry(Registry):
+            pass
+
+        self.assertRaises(TypeError, IncompleteRegistry)
+
+    def test_should_iterate_over_fetched_key_value_pairs(self):
+        """
+        Test that iterating over fetched pairs yields the same pairs as fetch.
+        """
+        self.registry.put("/parent/child1", "1")
+        self.registry.put("/parent/child1/A", "1A")
+        self.registry.put("/parent/child2", "2")
+
+        self.assertListEqual(list(self.registry.iter_fetch("/parent", True)),
+                             list(self.registry.fetch("/parent", True).items()))
+
+    def test_should_notify_watches_of_changed_children(self):
+        """
+        Test that a watch is notified of changes to the watched key and its children only, until it is cancelled.
+        """
+        notifications = []
+        cancel = self.registry.watch_prefix("/parent", lambda: notifications.append(True))
+
+        self.registry.put("/parent", "")
+        self.registry.put_all({"/parent/child1": "1", "/parent/child2": "2"})
+        self.registry.put("/parentA", "")
+        self.assertEqual(len(notifications), 2)
+
+        cancel()
+        self.registry.put("/parent/child3", "3")
+        self.assertEqual(len(notifications), 2)
@@ -1,6 +1,6 @@
 import unittest
 
-from scoutlight.registry.key import Key
+from scoutlight.registry.key import Key, KeyException
 
 
 class KeyTest(unittest.TestCase):
@@ -15,6 +15,13 @@ class KeyTest(unittest.TestCase):
         key = Key.create("some_key")
         self.assertEqual(str(key), "/some_key")
 
+    def test_should_reuse_created_key(self):
+        """
+        Test that creating a key from the same string again returns the cached Key object, rather than parsing it again.
+        """
+        self.assertIs(Key.create("/parent/child1"), Key.create("/parent/child1"))
+        self.assertIsNot(Key.create("/parent/child1"), Key.create("/parent/child2"))
+
     def test_should_match_parent_key(self):
         """
         Test that a given key starts with a given parent key.
@@ -49,3 +56,32 @@ class KeyTest(unittest.TestCase):
 
         self.assertTrue(key.is_immediate_parent(immediate_parent))
         self.assertFalse(key.is_immediate_parent(non_immediate_parent))
+
+    def test_should_not_detect_immediate_parent_of_other_branch(self):
+        """
+        Test that a key one level up, but on another branch, or the key itself, is not an immediate parent.
+        """
+        key = Key.create("/repository/services/PrintService")
+
+        self.assertFalse(key.is_immediate_parent(Key.create("/repository/clusters")))
+        self.assertFalse(key.is_immediate_parent(key))
+        self.assertFalse(Key.create("/repository").is_immediate_parent(key))
+
+    def test_should_get_parent_key(self):
+        """
+        Test that the parent of a key is the key without its last part.
+        """
+        key = Key.create("/repository/services/PrintService")
+
+        self.assertEqual(key.get_parent(), Key.create("/repository/services"))
+        self.assertEqual(Key.create("/repository").get_parent(), Key.create("/"))
+        self.assertRaises(KeyException, lambda: Key.create("/").get_parent())
+
+    def test_should_create_relative_key(self):
+        """
+        Test that a relative key is appended to a key, whether given as a string or as a Key.
+        """
+        key = Key.create("/repository/services")
+
+        self.assertEqual(key.relative("PrintService/queue/"), Key.create("/repository/services/PrintService/queue"))
+        self.assertEqual(key.relative(Key.create("PrintService")), Key.create("/repository/services/PrintService"))
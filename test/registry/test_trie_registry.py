@@ -0,0 +1,196 @@
+import unittest
+
+from typing import List, Dict
+
+from scoutlight.registry import KeyDoesNotExist, Key
+from scoutlight.registry.trie_registry import TrieRegistry
+
+SAMPLE_KEY = Key.create("/sampleKey")
+SAMPLE_VALUE = "value"
+
+
+class TestTrieRegistry(unittest.TestCase):
+    """
+    Test cases for TrieRegistry.
+    """
+
+    def setUp(self):
+        """
+        Test fixture -- create an empty registry.
+        """
+        self.registry = TrieRegistry()
+
+    def test_should_get_single_key(self):
+        """
+        Test that querying for an existing key, we get our expected value.
+        """
+
+        self.registry.put(SAMPLE_KEY, SAMPLE_VALUE)
+
+        # Query our registry to look the key up.
+        result = self.registry.get(SAMPLE_KEY)
+
+        self.assertEqual(result, SAMPLE_VALUE)
+
+    def test_should_catch_exception_when_key_does_not_exist(self):
+        """
+        Test that querying for a non-existing key raises an exception.
+        """
+
+        # Query for a non-existing key. It should raise KeyDoesNotExist exception.
+        self.assertRaises(KeyDoesNotExist, lambda: self.registry.get(SAMPLE_KEY))
+
+    def test_should_list_immediate_children_keys(self):
+        """
+        Test that the registry return list of all immediate children keys of a given parent.
+        """
+        self.registry.put("/parent/child1", "")
+        self.registry.put("/parent/child2", "")
+        self.registry.put("/parent/child3", "")
+        self.registry.put("/parent/child3/A", "")
+        self.registry.put("/parentA", "")
+
+        result = self.registry.list_keys("/parent")  # type: List[str]
+
+        # Assert we got only the immediate children or '/parent'.
+        self.assertListEqual(sorted(result), sorted(["/parent/child1", "/parent/child2", "/parent/child3"]))
+
+    def test_should_list_all_children_keys(self):
+        """
+        Test that the registry return list of all children keys of a given parent, both immediate and descendant.
+        """
+        self.registry.put("/parent/child1", "")
+        self.registry.put("/parent/child2", "")
+        self.registry.put("/parent/child3", "")
+        self.registry.put("/parent/child3/A", "")
+        self.registry.put("/parentA", "")
+
+        result = self.registry.list_keys("/parent", True)  # type: List[str]
+
+        # Assert we got only the immediate children or '/parent'.
+        self.assertListEqual(sorted(result),
+                             sorted(["/parent/child1", "/parent/child2", "/parent/child3", "/parent/child3/A"]))
+
+    def test_should_fetch_all_key_value_pairs_for_parent_key(self):
+        """
+        Test that fetching all keys and values return all the children key/value pairs under a given parent key.
+        """
+        self.registry.put("/parent/child1", "1")
+        self.registry.put("/parent/child2", "2")
+        self.registry.put("/parent/child3", "3")
+        self.registry.put("/parent/child3/A", "3A")
+        self.registry.put("/parentA", "")
+
+        result = self.registry.fetch("/parent", True, True)  # type: Dict[str, str]
+
+        # We expect to get a dictionary with 4 key/value pairs, in order of creation.
+        expected_results = {
+            "/parent/child1": "1",
+            "/parent/child2": "2",
+            "/parent/child3": "3",
+            "/parent/child3/A": "3A",
+        }
+
+        self.assertDictEqual(expected_results, result)
+        self.assertListEqual(list(result.items()), list(expected_results.items()))
+
+    def test_should_put_all_key_value_pairs(self):
+        """
+        Test that putting a list of key/value pairs sets each of the pairs.
+        """
+        self.registry.put_all([("/parent/child1", "1"), ("/parent/child2", "2")])
+
+        self.assertEqual(self.registry.get("/parent/child1"), "1")
+        self.assertEqual(self.registry.get("/parent/child2"), "2")
+
+    def test_should_not_list_parent_nodes_without_a_value(self):
+        """
+        Test that keys which were never set are not listed, even if their children were set.
+        """
+        self.registry.put("/parent/child1/A", "")
+
+        self.assertListEqual(self.registry.list_keys("/parent"), [])
+        self.assertRaises(KeyDoesNotExist, lambda: self.registry.get("/parent/child1"))
+
+    def test_should_list_keys_in_order_of_creation(self):
+        """
+        Test that keys are listed in order of creation when requested to keep order.
+        """
+        self.registry.put("/parent/b", "")
+        self.registry.put("/parent/c", "")
+        self.registry.put("/parent/a", "")
+
+        result = self.registry.list_keys("/parent", keep_order=True)  # type: List[str]
+
+        self.assertListEqual(result, ["/parent/b", "/parent/c", "/parent/a"])
+
+    def test_should_put_only_if_key_does_not_exist(self):
+        """
+        Test that a conditional put sets a key only if it does not exist yet.
+        """
+        self.assertTrue(self.registry.put_if_not_exist(SAMPLE_KEY, SAMPLE_VALUE))
+        self.assertFalse(self.registry.put_if_not_exist(SAMPLE_KEY, "other"))
+
+        self.assertEqual(self.registry.get(SAMPLE_KEY), SAMPLE_VALUE)
+
+    def test_should_get_existing_value_instead_of_putting(self):
+        """
+        Test that a conditional put-or-get returns the existing value if the key already exists.
+        """
+        self.assertTupleEqual(self.registry.put_if_not_exist_or_get(SAMPLE_KEY, SAMPLE_VALUE), (True, SAMPLE_VALUE))
+        self.assertTupleEqual(self.registry.put_if_not_exist_or_get(SAMPLE_KEY, "other"), (False, SAMPLE_VALUE))
+
+    def test_should_limit_listed_keys(self):
+        """
+        Test that listing keys with a limit returns only the first keys, in the requested order.
+        """
+        self.registry.put("/parent/b", "")
+        self.registry.put("/parent/b/A", "")
+        self.registry.put("/parent/c", "")
+        self.registry.put("/parent/a", "")
+
+        self.assertEqual(len(self.registry.list_keys("/parent", limit=2)), 2)
+        self.assertListEqual(self.registry.list_keys("/parent", keep_order=True, limit=2), ["/parent/b", "/parent/c"])
+        self.assertDictEqual(self.registry.fetch("/parent", True, True, limit=2), {"/parent/b": "", "/parent/b/A": ""})
+
+    def test_should_put_all_keys_in_given_creation_order(self):
+        """
+        Test that putting pre-split keys sets all values and records their creation in the given order.
+        """
+        self.registry.put_all_keys([(Key.create("/parent/b/A"), "bA"),
+                                    (Key.create("/parent/c"), "c"),
+                                    (Key.create("/parent/b"), "b"),
+                                    (Key.create("/parent/a"), "a")])
+
+        result = self.registry.fetch("/parent", True, True)  # type: Dict[str, str]
+
+        self.assertListEqual(list(result.items()),
+                             [("/parent/b/A", "bA"), ("/parent/c", "c"), ("/parent/b", "b"), ("/parent/a", "a")])
+
+    def test_should_iterate_over_fetched_key_value_pairs(self):
+        """
+        Test that iterating over fetched pairs yields the same pairs as fetch.
+        """
+        self.registry.put("/parent/child1", "1")
+        self.registry.put("/parent/child1/A", "1A")
+        self.registry.put("/parent/child2", "2")
+
+        self.assertDictEqual(dict(self.registry.iter_fetch("/parent", True)), self.registry.fetch("/parent", True))
+        self.assertListEqual(list(self.registry.iter_fetch("/parent", keep_order=True)),
+                             [("/parent/child1", "1"), ("/parent/child2", "2")])
+
+    def test_should_notify_watches_of_changed_children(self):
+        """
+        Test that a watch is notified of changes to the watched key and its children only, until it is cancelled.
+        """
+        notifications = []
+        cancel = self.registry.watch_prefix("/parent", lambda: notifications.append(True))
+
+        self.registry.put("/parent", "")
+        self.registry.put_all({"/parent/child1": "1", "/parent/child2": "2"})
+        self.registry.put("/parentA", "")
+        self.assertEqual(len(notifications), 2)
+
+        cancel()
+        self.registry.put("/parent/child3", "3")
+        self.assertEqual(len(notifications), 2)
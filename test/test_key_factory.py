@@ -0,0 +1,36 @@
+import unittest
+
+from scoutlight.key_factory import Keys
+
+
+class TestKeys(unittest.TestCase):
+    """
+    Test cases for Keys factory methods.
+    """
+
+    def test_should_create_service_instance_key(self):
+        """
+        Test that a service instance key is composed of cluster id, service name and instance id.
+        """
+        key = Keys.create_service_instance_key("my_cluster", "my_service", "1234")
+
+        self.assertEqual(key, "/my_cluster/services/my_service/members/1234")
+
+    def test_should_reject_invalid_input(self):
+        """
+        Test that empty, whitespace-only and non-string inputs are rejected.
+        """
+        self.assertRaises(ValueError, lambda: Keys.create_cluster_key(""))
+        self.assertRaises(ValueError, lambda: Keys.create_service_key("my_cluster", "  "))
+        self.assertRaises(ValueError, lambda: Keys.create_service_members_base_key("my_cluster", 1))
+
+    def test_should_derive_members_keys_from_service_key(self):
+        """
+        Test that members and instance keys extend the service key, normalized alike for padded inputs.
+        """
+        service_key = Keys.create_service_key(" my_cluster ", " my_service ")
+
+        self.assertEqual(Keys.create_service_members_base_key(" my_cluster ", " my_service "),
+                         service_key + "/members")
+        self.assertEqual(Keys.create_service_instance_key(" my_cluster ", " my_service ", " 1234 "),
+                         service_key + "/members/ 1234")
@@ -0,0 +1,40 @@
+import unittest
+
+from scoutlight.properties_serializer import JsonDictPropertiesConverter, MalformedPropertiesException, \
+    UnsupportedPropertiesTypeException
+
+
+class TestJsonDictPropertiesConverter(unittest.TestCase):
+    """
+    Test cases for JsonDictPropertiesConverter.
+    """
+
+    def setUp(self):
+        """
+        Test fixture -- create a new converter.
+        """
+        self.converter = JsonDictPropertiesConverter()
+
+    def test_should_convert_properties_to_string_and_back(self):
+        """
+        Test that properties serialized to string are deserialized back to the same properties.
+        """
+        properties = {"hostname": "192.168.1.101", "port": "8001", "protocol": "https"}
+
+        raw_properties = self.converter.to_string(properties)
+
+        self.assertIsInstance(raw_properties, str)
+        self.assertDictEqual(self.converter.from_string(raw_properties), properties)
+
+    def test_should_reject_unsupported_type(self):
+        """
+        Test that serializing a non-dictionary object raises an exception.
+        """
+        self.assertRaises(UnsupportedPropertiesTypeException, lambda: self.converter.to_string(["hostname"]))
+
+    def test_should_reject_malformed_properties(self):
+        """
+        Test that deserializing malformed JSON, or JSON which is not an object, raises an exception.
+        """
+        self.assertRaises(MalformedPropertiesException, lambda: self.converter.from_string("{hostname"))
+        self.assertRaises(MalformedPropertiesException, lambda: self.converter.from_string("[1, 2]"))
@@ -0,0 +1,29 @@
+import unittest
+
+from scoutlight.registry import Key
+from scoutlight.tools.cluster_keys import ClusterKeys
+
+
+class ClusterKeysTest(unittest.TestCase):
+    """
+    Test cases for ClusterKeys.
+    """
+
+    def test_should_create_service_keys(self):
+        """
+        Test that service and service instance keys are created under the cluster's services key.
+        """
+        cluster_keys = ClusterKeys("my_cluster")
+
+        self.assertEqual(cluster_keys.service_key("my_service"), Key.create("/my_cluster/services/my_service"))
+        self.assertEqual(cluster_keys.service_instance("my_service", "1"),
+                         Key.create("/my_cluster/services/my_service/1"))
+
+    def test_should_reuse_created_keys(self):
+        """
+        Test that repeated calls return the same key objects.
+        """
+        cluster_keys = ClusterKeys("my_cluster")
+
+        self.assertIs(cluster_keys.service_key("my_service"), cluster_keys.service_key("my_service"))
+        self.assertIs(cluster_keys.service_instance("my_service", "1"), cluster_keys.service_instance("my_service", "1"))
@@ -0,0 +1,24 @@
+import unittest
+import uuid
+
+from scoutlight.tools.identifier_generator import UUID4IdentifierGenerator
+
+
+class UUID4IdentifierGeneratorTest(unittest.TestCase):
+    """
+    Test cases for UUID4IdentifierGenerator.
+    """
+
+    def test_should_generate_unique_uuid4_hex_strings(self):
+        """
+        Test that generated identifiers are distinct, valid, UUID4 hex strings.
+        """
+        generator = UUID4IdentifierGenerator()
+        identifiers = [generator.generate() for _ in range(100)]
+
+        self.assertEqual(len(set(identifiers)), len(identifiers))
+        for identifier in identifiers:
+            parsed = uuid.UUID(hex=identifier)
+            self.assertEqual(parsed.hex, identifier)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
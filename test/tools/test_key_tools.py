@@ -0,0 +1,32 @@
+import unittest
+
+from scoutlight.tools.key_tools import normalize_key, parts_start_with
+
+
+class KeyToolsTest(unittest.TestCase):
+    """
+    Test cases for key tools.
+    """
+
+    def test_should_normalize_key(self):
+        """
+        Test that a normalized key starts with a single forward slash, has no duplicate or trailing forward slashes and
+        no leading or trailing spaces.
+        """
+        self.assertEqual(normalize_key(" //my//service/ "), "/my/service")
+        self.assertEqual(normalize_key("my/service"), "/my/service")
+
+    def test_should_normalize_root_key_to_empty_string(self):
+        """
+        Test that a key with no parts is normalized to an empty string.
+        """
+        self.assertEqual(normalize_key("///"), "")
+
+    def test_should_match_key_parts_prefix(self):
+        """
+        Test that key parts start with their own prefixes only.
+        """
+        self.assertTrue(parts_start_with(("my", "service", "demo"), ("my", "service")))
+        self.assertTrue(parts_start_with(("my", "service"), ["my", "service"]))
+        self.assertFalse(parts_start_with(("my", "service"), ("my", "serv")))
+        self.assertFalse(parts_start_with(("my",), ("my", "service")))
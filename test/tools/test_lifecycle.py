@@ -0,0 +1,36 @@
+import unittest
+
+from scoutlight.tools.lifecycle import Lifecycle, LifecycleException, LifecycleState
+
+
+class LifecycleTest(unittest.TestCase):
+    """
+    Test cases for Lifecycle.
+    """
+
+    def test_should_transition_through_states(self):
+        """
+        Test that a lifecycle moves from created, to initialized, to destroyed.
+        """
+        lifecycle = Lifecycle()
+        self.assertEqual(lifecycle.lifecycle_state, LifecycleState.CREATED)
+        self.assertRaises(LifecycleException, lifecycle._assert_state)
+
+        lifecycle.setup()
+        self.assertEqual(lifecycle.lifecycle_state, LifecycleState.INITIALIZED)
+        lifecycle._assert_state()
+
+        lifecycle.destroy()
+        self.assertEqual(lifecycle.lifecycle_state, LifecycleState.DESTROYED)
+        self.assertRaises(LifecycleException, lifecycle._assert_state)
+
+    def test_should_not_setup_twice(self):
+        """
+        Test that an initialized or destroyed lifecycle cannot be set up.
+        """
+        lifecycle = Lifecycle()
+        lifecycle.setup()
+        self.assertRaises(LifecycleException, lifecycle.setup)
+
+        lifecycle.destroy()
+        self.assertRaises(LifecycleException, lifecycle.setup)
@@ -0,0 +1,43 @@
+import unittest
+
+from scoutlight.tools.object_editor import ObjectEditorRegistry, DictObjectEditor, ClassObjectEditor
+
+
+class _Sample(object):
+    pass
+
+
+class ObjectEditorRegistryTest(unittest.TestCase):
+    """
+    Test cases for ObjectEditorRegistry.
+    """
+
+    def setUp(self):
+        """
+        Test fixture -- create a registry with the basic object editors.
+        """
+        self.registry = ObjectEditorRegistry()
+        self.registry.add_editor(DictObjectEditor())
+        self.registry.add_editor(ClassObjectEditor())
+
+    def test_should_set_and_get_values_of_supported_objects(self):
+        """
+        Test that values are set and retrieved via the editor supporting each object.
+        """
+        d = {}
+        sample = _Sample()
+
+        self.registry.set_value(d, "name", "value")
+        self.registry.set_value(sample, "name", "value")
+
+        self.assertEqual(self.registry.get_value(d, "name"), "value")
+        self.assertEqual(self.registry.get_value(sample, "name"), "value")
+
+    def test_should_find_same_editor_for_same_type(self):
+        """
+        Test that the editor found for an object type is reused for other objects of the same type.
+        """
+        editor = self.registry.find_editor_for({})
+
+        self.assertIs(self.registry.find_editor_for({"a": 1}), editor)
+        self.assertIsInstance(editor, DictObjectEditor)
@@ -1,16 +1,24 @@
+import threading
 import time
 import unittest
 
-from scoutlight.tools.periodic_timer import PeriodicTimer
+from scoutlight.tools.periodic_timer import PeriodicTimer, SHARED_BACKEND, SIGNAL_BACKEND, BOOTTIME_CLOCK, \
+    COALESCE_OVERRUN, REPLAY_OVERRUN, DROP_OVERRUN
 
 
 class Counter:
 
-    def __init__(self):
+    def __init__(self, target=None):
         self.value = 0
 
+        # Set once the counter reaches its target value (if any).
+        self.target = target
+        self.done = threading.Event()
+
     def increment(self):
         self.value += 1
+        if self.value == self.target:
+            self.done.set()
 
 
 class TestPeriodicTimer(unittest.TestCase):
@@ -26,21 +34,141 @@ class TestPeriodicTimer(unittest.TestCase):
         timer.stop()
         self.assertFalse(timer.is_running())
 
+    def test_should_not_wait_forever_for_a_blocked_callback(self):
+        """
+        Test that stopping a timer whose callback is blocked gives up after the stop timeout.
+        """
+        release_event = threading.Event()
+        callback_event = threading.Event()
+
+        def blocked_callback():
+            callback_event.set()
+            release_event.wait()
+
+        timer = PeriodicTimer(0.1, blocked_callback, name='blocked-timer')
+        timer.start()
+        callback_event.wait(1)
+
+        # Stopping should give up after 2 intervals and the grace period (1.2 seconds).
+        with self.assertLogs('scoutlight.tools.periodic_timer', 'WARNING') as logs:
+            timer.stop()
+
+        self.assertIn("did not exit within the stop timeout (blocked-timer)", logs.output[0])
+        self.assertFalse(timer.is_running())
+
+        release_event.set()
+        self.assertTrue(timer._exit_event.wait(1))
+
+    def test_should_stop_timer_from_its_own_callback(self):
+        """
+        Test that a timer stopped from its own callback does not wait for itself to exit.
+        """
+        stop_durations = []
+
+        def stop_timer():
+            start_time = time.monotonic()
+            timer.stop()
+            stop_durations.append(time.monotonic() - start_time)
+
+        timer = PeriodicTimer(0.05, stop_timer)
+        timer.start()
+
+        self.assertTrue(timer._exit_event.wait(1))
+        self.assertEqual(len(stop_durations), 1)
+        self.assertLess(stop_durations[0], 0.5)
+        self.assertFalse(timer.is_running())
+
+    def test_should_reuse_worker_threads(self):
+        """
+        Test that a timer started after another timer stopped runs on the same (idle) worker thread, named after the
+        timer.
+        """
+        threads = []
+
+        def record_thread():
+            threads.append((threading.current_thread(), threading.current_thread().name))
+
+        for name in ('first-timer', 'second-timer'):
+            timer = PeriodicTimer(0.05, record_thread, name=name)
+            timer.start()
+            time.sleep(0.08)
+            timer.stop()
+
+        self.assertEqual(len(threads), 2)
+        self.assertIs(threads[0][0], threads[1][0])
+        self.assertListEqual([thread_name for _, thread_name in threads], ['first-timer', 'second-timer'])
+
     def test_should_issue_callbacks(self):
         """
         Test that our time issue calls to the callback function as predicted.
         """
-        counter = Counter()
+        counter = Counter(target=2)
 
         timer = PeriodicTimer(1, counter.increment)
         timer.start()
-        time.sleep(3)
+        self.assertTrue(counter.done.wait(3.5))
+        time.sleep(0.1)
         timer.stop()
 
-        # The periodic timer was running for 3 seconds with internal of 1 second.
+        # The periodic timer was running for about 2 seconds with internal of 1 second.
         # Callback should have been issued between 2 and 4 times.
         self.assertTrue(2 <= counter.value < 4)
 
+    def test_should_not_drift_by_callback_duration(self):
+        """
+        Test that the time spent in the callback does not delay the following ticks.
+        """
+        counter = Counter()
+
+        def slow_increment():
+            counter.increment()
+            time.sleep(0.05)
+
+        timer = PeriodicTimer(0.1, slow_increment)
+        timer.start()
+        time.sleep(1.05)
+        timer.stop()
+
+        # Waiting 0.1 seconds after every 0.05 seconds callback would have issued the callback only 7 times.
+        self.assertTrue(9 <= counter.value <= 10)
+
+    def test_should_issue_callbacks_by_boot_time_clock(self):
+        """
+        Test that a timer measured by the boot-time clock issues its callbacks like a monotonic one.
+        """
+        counter = Counter()
+
+        timer = PeriodicTimer(0.1, counter.increment, clock=BOOTTIME_CLOCK)
+        timer.start()
+        time.sleep(0.55)
+        timer.stop()
+
+        self.assertTrue(4 <= counter.value <= 5)
+
+    def test_should_handle_overruns_by_policy(self):
+        """
+        Test that ticks passing during a long callback are coalesced, replayed or dropped by the overrun policy.
+        """
+        # The first callback (at 0.1s) takes 0.35 seconds, during which 3 more ticks pass. 2 more ticks pass until
+        # 0.65s.
+        expected_counts = {COALESCE_OVERRUN: 1 + 1 + 2, REPLAY_OVERRUN: 1 + 3 + 2, DROP_OVERRUN: 1 + 0 + 2}
+
+        for on_overrun, expected_count in expected_counts.items():
+            with self.subTest(on_overrun=on_overrun):
+                counter = Counter()
+
+                def slow_first_increment():
+                    counter.increment()
+                    if counter.value == 1:
+                        time.sleep(0.35)
+
+                timer = PeriodicTimer(0.1, slow_first_increment, on_overrun=on_overrun)
+                timer.start()
+                time.sleep(0.65)
+                timer.stop()
+
+                self.assertEqual(counter.value, expected_count)
+
     def test_should_fail_timer_thread_due_to_errors(self):
         """
         Test should cause the periodic time to terminate after a few consecutive failures.
@@ -49,11 +177,93 @@ class TestPeriodicTimer(unittest.TestCase):
         def raise_exception():
             raise Exception()
 
-        timer = PeriodicTimer(0.5, raise_exception)
+        timer = PeriodicTimer(0.5, raise_exception, name='failing-timer')
         timer.set_max_failure_count(3)
-        timer.start()
-        time.sleep(2)
+        with self.assertLogs('scoutlight.tools.periodic_timer') as logs:
+            timer.start()
+
+            # The timer sets its stop event when it gives up; wait for its thread to exit.
+            self.assertTrue(timer._stop_event.wait(2))
+            timer.stop()
 
         # Make sure our timer has exited after 2 failures.
         self.assertFalse(timer.is_running())
         self.assertEqual(timer.failure_count, 3)
+
+        self.assertIn("Maximum number of failures reached (count: 3)", logs.output[-2])
+        self.assertIn("Terminating periodic timer thread (failing-timer).", logs.output[-2])
+
+    def test_should_run_shared_timers_on_a_single_thread(self):
+        """
+        Test that timers of the shared backend issue their callbacks from a single scheduler thread.
+        """
+        threads = {'fast': set(), 'slow': set()}
+
+        fast_timer = PeriodicTimer(0.1, lambda: threads['fast'].add(threading.current_thread()),
+                                   backend=SHARED_BACKEND)
+        slow_timer = PeriodicTimer(0.25, lambda: threads['slow'].add(threading.current_thread()),
+                                   backend=SHARED_BACKEND)
+        fast_timer.start()
+        slow_timer.start()
+        self.assertTrue(fast_timer.is_running())
+        self.assertTrue(slow_timer.is_running())
+
+        time.sleep(0.6)
+        fast_timer.stop()
+        slow_timer.stop()
+        self.assertFalse(fast_timer.is_running())
+        self.assertFalse(slow_timer.is_running())
+
+        self.assertEqual(len(threads['fast']), 1)
+        self.assertEqual(threads['fast'], threads['slow'])
+        self.assertNotIn(threading.current_thread(), threads['fast'])
+
+    def test_should_fail_shared_timer_due_to_errors(self):
+        """
+        Test should cause a shared periodic timer to stop after a few consecutive failures, without affecting other
+        shared timers.
+        """
+        counter = Counter()
+
+        def raise_exception():
+            raise Exception()
+
+        failing_timer = PeriodicTimer(0.1, raise_exception, backend=SHARED_BACKEND)
+        failing_timer.set_max_failure_count(3)
+        timer = PeriodicTimer(0.1, counter.increment, backend=SHARED_BACKEND)
+        failing_timer.start()
+        timer.start()
+        time.sleep(0.55)
+
+        self.assertFalse(failing_timer.is_running())
+        self.assertEqual(failing_timer.failure_count, 3)
+        self.assertTrue(timer.is_running())
+        self.assertTrue(4 <= counter.value <= 5)
+
+        timer.stop()
+
+    def test_should_run_signal_timers_on_the_main_thread(self):
+        """
+        Test that timers of the signal backend issue their callbacks on the main thread, and that a timer can stop
+        itself from its callback.
+        """
+        counter = Counter()
+        threads = set()
+
+        def increment():
+            threads.add(threading.current_thread())
+            counter.increment()
+
+        timer = PeriodicTimer(0.1, increment, backend=SIGNAL_BACKEND)
+        self_stopping_timer = PeriodicTimer(0.1, lambda: self_stopping_timer.stop(), backend=SIGNAL_BACKEND)
+        timer.start()
+        self_stopping_timer.start()
+        self.assertTrue(timer.is_running())
+
+        time.sleep(0.55)
+        self.assertFalse(self_stopping_timer.is_running())
+        timer.stop()
+        self.assertFalse(timer.is_running())
+
+        self.assertTrue(4 <= counter.value <= 5)
+        self.assertEqual(threads, {threading.main_thread()})